@@ -1,13 +1,24 @@
+import hashlib
 import os
+import re
 import sys
+import threading
 import fitz
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import PurePath
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
     QFileDialog, QLabel, QLineEdit, QScrollArea, QMessageBox, QTableWidget,
-    QTableWidgetItem, QStackedWidget, QSlider, QSplitter, QFrame
+    QTableWidgetItem, QStackedWidget, QSlider, QSplitter, QFrame, QListView,
+    QAbstractItemView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QStyleOptionButton
+)
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache, QFont, QIcon, QRegularExpressionValidator
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex,
+    QSize, QEvent, QRegularExpression, pyqtSignal
 )
-from PyQt5.QtGui import QImage, QPixmap, QFont, QIcon
-from PyQt5.QtCore import Qt
 
 # ============================================================================
 # Constants and Configuration
@@ -21,9 +32,22 @@ class Config:
     DEFAULT_FONT_SIZE = 11
     DEFAULT_BUTTON_HEIGHT = 36
 
+    # Navigation Settings
+    KEY_REPEAT_RENDER_MS = 50  # a held arrow key renders at most once per interval
+
     # Zoom Settings
     ZOOM_LIMITS = (0.1, 5.0)
     ZOOM_STEP = 1.2
+    ZOOM_WHEEL_DELAY_MS = 16  # wheel zoom re-renders at most once per frame
+    ZOOM_INPUT_DELAY_MS = 150  # typed zoom values re-render once editing settles
+    PAGE_CACHE_MAX = 20  # rendered pages kept for revisits
+    PAGE_CACHE_LIMIT_BYTES = 256 * 1024 * 1024
+    PREFETCH_MAX_PIXELS = 4 * 1024 * 1024  # larger neighbouring pages are not rendered ahead
+    ZOOM_MATRIX_CACHE_MAX = 32  # zoom levels whose render matrix is kept
+    MUPDF_STORE_BYTES = 16 * 1024 * 1024  # MuPDF's font/image store is shrunk back below this
+    MUPDF_STORE_SHRINK_RENDERS = 8  # without a store size, shrink it by a fixed share this often
+    MUPDF_STORE_SHRINK_PERCENT = 50
+    LIMIT_RENDERING_CACHE = False  # memory mode: no anti-aliasing, MuPDF's store emptied after each render
 
     # Widget Dimensions
     BUTTON_WIDTHS = {
@@ -38,20 +62,324 @@ class Config:
     THUMBNAIL_DEFAULT_WIDTH = 100
     THUMBNAIL_MIN_HEIGHT = 100
     THUMBNAIL_SPACING = 10
+    THUMBNAIL_OVERSCAN = 2  # pages rendered beyond each edge of the visible area
+    THUMBNAIL_CACHE_LIMIT_KB = 65536
+    THUMBNAIL_ID_BYTES = 64 * 1024  # leading file bytes hashed to recognise a reopened document
+    THUMBNAIL_RESIZE_DELAY_MS = 150
+    THUMBNAIL_GRAYSCALE = True  # 1 byte per pixel instead of 3, set False for color previews
+    THUMBNAIL_RENDER_THREADS = 1  # PyMuPDF is not thread-safe, keep MuPDF work on one worker
+    THUMBNAIL_WARM_PAGES = 100  # pages pre-rendered in the background after a PDF opens
+    THUMBNAIL_MODEL_PAGES = 64  # full size renders the list holds, dropped ones come back from the pixmap cache
+
+    # Split Settings
+    SPLIT_WRITE_THREADS = 8  # split parts written to disk concurrently
+
+    # Page Move Settings
+    UNDO_DEPTH = 50  # page moves kept for undo
 
     # File Settings
     PDF_MAGIC_NUMBER = b"%PDF"
     PDF_FILTER = "PDF files (*.pdf)"
 
+# ============================================================================
+# Fonts
+# ============================================================================
+
+_FONT_CACHE = {}  # point size -> QFont shared by every widget using that size
+
+
+def _font(size):
+    """Shared font of the given point size"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = QFont()
+        font.setPointSize(size)
+        _FONT_CACHE[size] = font
+    return font
+
+# ============================================================================
+# Documents
+# ============================================================================
+
+def _open_pdf(path):
+    """Open a file as a PDF regardless of its extension, raising if it isn't one"""
+    return fitz.open(path, filetype="pdf")
+
+
+def _mupdf_store_size():
+    """Bytes held in MuPDF's resource store, None on builds where store_size is a stub"""
+    # A property on classic PyMuPDF, a method on the rebased bindings
+    size = fitz.TOOLS.store_size
+    return size() if callable(size) else size
+
+# ============================================================================
+# Thumbnail Rendering
+# ============================================================================
+
+# PyMuPDF is not thread-safe, background renders take turns on this lock
+_RENDER_LOCK = threading.Lock()
+
+# Workers keep the document of their current load open, opening costs more than a render
+_thumbnail_documents = {}  # (path, generation) -> document
+_page_documents = {}
+
+
+def _worker_document(documents, path, generation):
+    """Document of a worker's load, opened once per load. Call with _RENDER_LOCK held"""
+    key = (path, generation)
+    pdf = documents.get(key)
+    if pdf is None:
+        _close_worker_documents(documents)
+        pdf = documents[key] = _open_pdf(path)
+    return pdf
+
+
+def _close_worker_documents(documents):
+    """Close the handle kept by a worker. Call with _RENDER_LOCK held"""
+    for pdf in documents.values():
+        pdf.close()
+    documents.clear()
+
+
+class ThumbnailSignals(QObject):
+    """Signals emitted by thumbnail render tasks"""
+    rendered = pyqtSignal(int, int, QImage)  # generation, page number, image
+
+
+class ThumbnailTask(QRunnable):
+    """Render a single page thumbnail off the GUI thread"""
+
+    def __init__(self, pdf_path, page_num, width, dpr, generation, signals, matrix_cache):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.page_num = page_num
+        self.width = width  # logical pixels, rendered at width * dpr device pixels
+        self.dpr = dpr
+        self.generation = generation
+        self.signals = signals
+        self.matrix_cache = matrix_cache  # shared by all tasks of one load, keyed by page width and dpr
+
+    def run(self):
+        try:
+            # Documents can't be shared across threads, the worker keeps its own handle
+            with _RENDER_LOCK:
+                page = _worker_document(_thumbnail_documents, self.pdf_path, self.generation)[self.page_num]
+                matrix_key = (page.rect.width, self.dpr)
+                matrix = self.matrix_cache.get(matrix_key)
+                if matrix is None:
+                    scale = self.width * self.dpr / page.rect.width
+                    matrix = self.matrix_cache[matrix_key] = fitz.Matrix(scale, scale)
+                if Config.THUMBNAIL_GRAYSCALE:
+                    colorspace, img_format = fitz.csGRAY, QImage.Format_Grayscale8
+                else:
+                    colorspace, img_format = fitz.csRGB, QImage.Format_RGB888
+                pix = page.get_pixmap(matrix=matrix, alpha=False, colorspace=colorspace)
+                # Wrap MuPDF's buffer without copying, then detach before pix is freed
+                img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                            img_format).copy()
+                img.setDevicePixelRatio(self.dpr)
+                del page, pix  # MuPDF objects are dropped while the lock is held
+            self.signals.rendered.emit(self.generation, self.page_num, img)
+        except Exception as e:
+            print(f"Error rendering thumbnail {self.page_num + 1}: {str(e)}")
+
+# ============================================================================
+# Page Prefetching
+# ============================================================================
+
+class PageRenderSignals(QObject):
+    """Signals emitted by page render tasks"""
+    rendered = pyqtSignal(int, int, float, QImage)  # generation, page number, zoom, image
+
+
+def _page_image(pix, dpr):
+    """Convert a MuPDF page raster to an image in QPixmap's native 32-bit format"""
+    # Wrap MuPDF's buffer without copying, the conversion gives the image its own
+    # pixels which QPixmap.fromImage then shares instead of converting again
+    img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride,
+                 QImage.Format_RGB888).convertToFormat(QImage.Format_RGB32)
+    img.setDevicePixelRatio(dpr)
+    return img
+
+
+class PageRenderTask(QRunnable):
+    """Render a viewer page off the GUI thread so navigating to it is instant"""
+
+    def __init__(self, pdf_path, page_num, zoom, dpr, generation, signals):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.page_num = page_num
+        self.zoom = zoom
+        self.dpr = dpr
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Documents can't be shared across threads, the worker keeps its own handle
+            with _RENDER_LOCK:
+                scale = self.zoom * self.dpr
+                page = _worker_document(_page_documents, self.pdf_path, self.generation)[self.page_num]
+                pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                del page  # MuPDF objects are dropped while the lock is held
+            # Convert here so the GUI thread only has to wrap the image in a pixmap
+            img = _page_image(pix, self.dpr)
+            del pix  # the image has its own pixels, free the raster before handing it over
+            self.signals.rendered.emit(self.generation, self.page_num, self.zoom, img)
+        except Exception as e:
+            print(f"Error prefetching page {self.page_num + 1}: {str(e)}")
+
+# ============================================================================
+# Thumbnail Model
+# ============================================================================
+
+class ThumbnailModel(QAbstractListModel):
+    """One row per page, pages are rendered lazily once they are painted"""
+    render_requested = pyqtSignal(int)  # page number
+
+    def __init__(self, lookup, parent=None):
+        super().__init__(parent)
+        self._lookup = lookup  # page number -> cached full size render or None
+        self._page_count = 0
+        self._box = QSize()  # logical size every thumbnail is fitted into
+        self._dpr = 1.0
+        self._transform = Qt.SmoothTransformation
+        self._masters = OrderedDict()  # full size renders, least recently painted first
+        self._scaled = OrderedDict()  # masters scaled to the current size
+        self._placeholder = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._page_count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        page_num = index.row()
+        if role == Qt.DisplayRole:
+            return f"Page {page_num + 1}"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.DecorationRole:
+            return self._thumbnail(page_num)
+        return None
+
+    def reset(self, page_count, width, aspect, dpr):
+        """Show a new document, all pages start out unrendered"""
+        self.beginResetModel()
+        self._page_count = page_count
+        self._dpr = dpr
+        self._masters = OrderedDict()
+        self._set_box(width, aspect)
+        self.endResetModel()
+
+    def set_width(self, width, transform=Qt.SmoothTransformation):
+        """Rescale the rendered thumbnails to a new width"""
+        self.layoutAboutToBeChanged.emit()
+        self._transform = transform
+        self._set_box(width, self._box.height() / self._box.width() if self._box.width() else 1)
+        self.layoutChanged.emit()
+
+    def set_master(self, page_num, pixmap):
+        """Store the full size render of a page"""
+        self._store_master(page_num, pixmap)
+        index = self.index(page_num)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def master(self, page_num):
+        """Full size render of a page, None until it has been rendered"""
+        return self._masters.get(page_num)
+
+    def restore_master(self, page_num):
+        """Take a dropped render back from the pixmap cache, False if it has to be rendered again"""
+        master = self._lookup(page_num)
+        if master is None:
+            return False
+        self._store_master(page_num, master)
+        return True
+
+    def _store_master(self, page_num, pixmap):
+        """Keep a page's render, dropping the least recently painted beyond the limit"""
+        self._masters[page_num] = pixmap
+        self._scaled.pop(page_num, None)
+        # Long documents would otherwise hold every page scrolled past
+        if len(self._masters) > Config.THUMBNAIL_MODEL_PAGES:
+            evicted, _ = self._masters.popitem(last=False)
+            self._scaled.pop(evicted, None)
+
+    def _set_box(self, width, aspect):
+        self._box = QSize(width, round(width * aspect))
+        self._scaled = OrderedDict()
+        self._placeholder = None
+
+    def _thumbnail(self, page_num):
+        """Scaled render of a page, a blank placeholder while it is rendered"""
+        pixmap = self._scaled.get(page_num)
+        if pixmap is not None:
+            self._masters.move_to_end(page_num)
+            self._scaled.move_to_end(page_num)
+            return pixmap
+
+        master = self._masters.get(page_num)
+        if master is None:
+            if self._placeholder is None:
+                self._placeholder = QPixmap(self._box * self._dpr)
+                self._placeholder.fill(Qt.white)
+                self._placeholder.setDevicePixelRatio(self._dpr)
+            return self._placeholder
+
+        # Only pages the view paints get scaled, fitted into the shared item size
+        self._masters.move_to_end(page_num)
+        dpr = master.devicePixelRatio()
+        pixmap = master.scaled(self._box * dpr, Qt.KeepAspectRatio, self._transform)
+        pixmap.setDevicePixelRatio(dpr)
+        self._scaled[page_num] = pixmap
+        return pixmap
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """Draw each thumbnail above its page label"""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.decorationPosition = QStyleOptionViewItem.Top
+
+    def paint(self, painter, option, index):
+        # Request renders from paint so rows only measured by the view are skipped
+        model = index.model()
+        if model.master(index.row()) is None and not model.restore_master(index.row()):
+            model.render_requested.emit(index.row())
+        super().paint(painter, option, index)
+
 # ============================================================================
 # Thumbnail Widget Component
 # ============================================================================
 
 class ThumbnailWidget(QWidget):
+    _MOVE_RE = re.compile(r"^\s*(\d+)\s*,\s*(\d+)\s*$")  # "source,target"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.thumbnail_width = Config.THUMBNAIL_DEFAULT_WIDTH
+        QPixmapCache.setCacheLimit(Config.THUMBNAIL_CACHE_LIMIT_KB)
+
+        # Resize thumbnails only once the slider settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._apply_thumbnail_size)
+
+        # Background rendering, results from outdated loads are ignored
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(Config.THUMBNAIL_RENDER_THREADS)
+        self._render_signals = ThumbnailSignals(self)
+        self._render_signals.rendered.connect(self._on_thumbnail_rendered)
+        self._generation = 0
+        self._pdf_id = None
+        self._pdf_path = None
+        self._matrix_cache = {}
+        self._requested = set()  # pages queued for rendering in the current load
+        self._dragging = False
+
         self.initUI()
 
     def initUI(self):
@@ -62,21 +390,16 @@ class ThumbnailWidget(QWidget):
 
         # Add page movement controls
         move_layout = QHBoxLayout()
+        font = _font(Config.DEFAULT_FONT_SIZE)
         move_label = QLabel("Move page: ")
-        font = move_label.font()
-        font.setPointSize(11)
         move_label.setFont(font)
         self.move_input = QLineEdit()
         self.move_input.setPlaceholderText("e.g. 2,3")
         self.move_input.setFixedWidth(100)
-        font = self.move_input.font()
-        font.setPointSize(11)
         self.move_input.setFont(font)
         self.move_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         move_btn = QPushButton("Move")
         move_btn.setMinimumHeight(36)
-        font = move_btn.font()
-        font.setPointSize(11)
         move_btn.setFont(font)
         move_btn.clicked.connect(self.move_page)
         move_layout.addWidget(move_label)
@@ -94,6 +417,8 @@ class ThumbnailWidget(QWidget):
         self.size_slider.setTickPosition(QSlider.TicksBelow)
         self.size_slider.setTickInterval(50)
         self.size_slider.valueChanged.connect(self.update_thumbnail_size)
+        self.size_slider.sliderPressed.connect(partial(self._set_drag, True))
+        self.size_slider.sliderReleased.connect(partial(self._set_drag, False))
 
         # Add size value label
         self.size_value_label = QLabel(f"{self.thumbnail_width}px")
@@ -126,24 +451,20 @@ class ThumbnailWidget(QWidget):
         size_layout.addWidget(self.size_value_label)
         layout.addLayout(size_layout)
 
-        # Scroll area for thumbnails
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        # Container for thumbnails
-        self.thumbnail_container = QWidget()
-        self.thumbnail_layout = QVBoxLayout()
-        self.thumbnail_layout.setSpacing(Config.THUMBNAIL_SPACING)
-        self.thumbnail_layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        self.thumbnail_container.setLayout(self.thumbnail_layout)
-
-        scroll.setWidget(self.thumbnail_container)
-        layout.addWidget(scroll)
-
-        # Set frame style
-        scroll.setFrameStyle(QFrame.StyledPanel)
+        # List of thumbnails, only rows scrolled into view are rendered
+        self.thumbnail_model = ThumbnailModel(self._cached_thumbnail, self)
+        self.thumbnail_model.render_requested.connect(self._request_thumbnail, Qt.QueuedConnection)
+        self.list_view = QListView()
+        self.list_view.setModel(self.thumbnail_model)
+        self.list_view.setItemDelegate(ThumbnailDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(Config.THUMBNAIL_SPACING // 2)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.list_view.setFrameStyle(QFrame.StyledPanel)
+        self.list_view.clicked.connect(lambda index: self.thumbnail_clicked(page_num=index.row()))
+        layout.addWidget(self.list_view)
 
         # Set size constraints
         self.setMinimumWidth(Config.THUMBNAIL_MIN_WIDTH - 20)
@@ -161,62 +482,112 @@ class ThumbnailWidget(QWidget):
         """Update the size of all thumbnails"""
         self.thumbnail_width = width
         self.size_value_label.setText(f"{width}px")
-        if hasattr(self.parent, 'current_pdf') and self.parent.current_pdf:
-            self.load_thumbnails(self.parent.current_pdf)
+        self._resize_timer.start(Config.THUMBNAIL_RESIZE_DELAY_MS)
+
+    def _set_drag(self, dragging):
+        """Track slider drags, a release redraws the thumbnails in full quality"""
+        self._dragging = dragging
+        if not dragging:
+            self._resize_timer.stop()
+            self._apply_thumbnail_size()
+
+    def _apply_thumbnail_size(self):
+        """Rescale the thumbnails from the rendered pages without re-rendering"""
+        # Cheap nearest-neighbour scaling while dragging, smooth once settled
+        mode = Qt.FastTransformation if self._dragging else Qt.SmoothTransformation
+        self.thumbnail_model.set_width(self.thumbnail_width, mode)
 
     def load_thumbnails(self, pdf):
         """Load thumbnails for all pages"""
-        # Clear existing thumbnails
-        for i in reversed(range(self.thumbnail_layout.count())):
-            self.thumbnail_layout.itemAt(i).widget().deleteLater()
+        # Drop pending renders of the previous load
+        self._render_pool.clear()
+        self._generation += 1
+        self._requested = set()
 
         if not pdf:
+            # Let go of the closed file, cached thumbnails are kept in case it is opened again
+            self.stop_rendering()
+            self.thumbnail_model.reset(0, self.thumbnail_width, 1, self.devicePixelRatioF())
+            return
+
+        self._pdf_id = self._document_id(pdf)
+        self._pdf_path = pdf.name
+        self._matrix_cache = {}  # pages of a document usually share one size
+
+        # Rows share the first page's size, other page sizes are fitted into it
+        page_count = len(pdf)
+        first_page = pdf[0].rect if page_count else None
+        aspect = first_page.height / first_page.width if first_page else 1
+        self.thumbnail_model.reset(page_count, self.thumbnail_width, aspect, self.devicePixelRatioF())
+
+        # Warm the cache once the event loop has shown the current page
+        QTimer.singleShot(0, self._warm_thumbnails)
+
+    def _document_id(self, pdf):
+        """Identify a document by its file so reopening it finds its cached thumbnails, None if it has no file"""
+        if not pdf.name:
+            return None
+        stat = os.stat(pdf.name)
+        digest = hashlib.blake2b(f"{stat.st_size}:{stat.st_mtime_ns}:".encode(), digest_size=16)
+        with open(pdf.name, "rb") as f:
+            digest.update(f.read(Config.THUMBNAIL_ID_BYTES))
+        return digest.hexdigest()
+
+    def _warm_thumbnails(self):
+        """Queue the leading pages for rendering behind the visible ones"""
+        dpr = self.devicePixelRatioF()
+        for page in range(min(self.thumbnail_model.rowCount(), Config.THUMBNAIL_WARM_PAGES)):
+            self._queue_thumbnail(page, dpr, priority=-1)
+
+    def stop_rendering(self):
+        """Drop queued thumbnail renders, wait for the running one and release the worker's document"""
+        self._render_pool.clear()
+        self._render_pool.waitForDone()
+        with _RENDER_LOCK:
+            _close_worker_documents(_thumbnail_documents)
+
+    def _request_thumbnail(self, page_num):
+        """Render a page the view asked for, along with its neighbours"""
+        dpr = self.devicePixelRatioF()  # render at device resolution for HiDPI screens
+        first = max(page_num - Config.THUMBNAIL_OVERSCAN, 0)
+        last = min(page_num + Config.THUMBNAIL_OVERSCAN, self.thumbnail_model.rowCount() - 1)
+        for page in range(first, last + 1):
+            self._queue_thumbnail(page, dpr)
+
+    def _queue_thumbnail(self, page_num, dpr, priority=0):
+        """Show a page from the cache or queue it for rendering unless it is shown or queued"""
+        if page_num in self._requested or self.thumbnail_model.master(page_num) is not None:
             return
 
-        # Create thumbnails for each page
-        for page_num in range(len(pdf)):
-            # Create frame for thumbnail
-            frame = QFrame()
-            frame.setFrameStyle(QFrame.StyledPanel)
-            frame_layout = QVBoxLayout()
-            frame.setLayout(frame_layout)
-
-            # Create thumbnail label
-            thumb_label = QLabel()
-            thumb_label.setAlignment(Qt.AlignCenter)
-
-            # Create editable page number field
-            page_num_layout = QHBoxLayout()
-            page_label = QLabel("Page")
-            page_num_input = QLineEdit(str(page_num + 1))
-            page_num_input.setFixedWidth(40)
-            page_num_input.setAlignment(Qt.AlignCenter)
-
-            # Add page label and number display (non-editable for now)
-            page_num_layout.addWidget(page_label)
-            page_num_layout.addWidget(page_num_input)
-            page_num_layout.setAlignment(Qt.AlignCenter)
-            page_num_input.setReadOnly(True)  # Make it read-only until we implement proper page moving
-
-            # Get page and create thumbnail
-            page = pdf[page_num]
-            matrix = fitz.Matrix(self.thumbnail_width/page.rect.width,
-                               self.thumbnail_width/page.rect.width)
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride,
-                        QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(img)
-
-            # Set thumbnail
-            thumb_label.setPixmap(pixmap)
-            frame_layout.addWidget(thumb_label)
-            frame_layout.addLayout(page_num_layout)
-
-            # Make thumbnail clickable
-            thumb_label.mousePressEvent = lambda e, num=page_num: self.thumbnail_clicked(e, num)
-            frame.mousePressEvent = lambda e, num=page_num: self.thumbnail_clicked(e, num)
-
-            self.thumbnail_layout.addWidget(frame)
+        # Reuse cached thumbnail, only render the page on a cache miss
+        pixmap = self._cached_thumbnail(page_num, dpr)
+        if pixmap is not None:
+            self.thumbnail_model.set_master(page_num, pixmap)
+        else:
+            self._requested.add(page_num)
+            self._render_pool.start(ThumbnailTask(self._pdf_path, page_num, Config.THUMBNAIL_MAX_WIDTH, dpr,
+                                                  self._generation, self._render_signals,
+                                                  self._matrix_cache), priority)
+
+    def _cached_thumbnail(self, page_num, dpr=None):
+        """Full size render of a page from the pixmap cache, None on a miss"""
+        if not self._pdf_id:  # documents without a file can't be told apart, they are never cached
+            return None
+        return QPixmapCache.find(self._cache_key(page_num, dpr or self.devicePixelRatioF()))
+
+    def _cache_key(self, page_num, dpr):
+        """Pixmap cache key of a page thumbnail, rendered once at the maximum width"""
+        return f"{self._pdf_id}:{page_num}:{dpr}"
+
+    def _on_thumbnail_rendered(self, generation, page_num, img):
+        """Show a thumbnail rendered by the background pool"""
+        if generation != self._generation:
+            return
+        self._requested.discard(page_num)
+        pixmap = QPixmap.fromImage(img)
+        if self._pdf_id:
+            QPixmapCache.insert(self._cache_key(page_num, img.devicePixelRatio()), pixmap)
+        self.thumbnail_model.set_master(page_num, pixmap)
 
     def thumbnail_clicked(self, event=None, page_num=None):
         """Handle thumbnail click"""
@@ -232,89 +603,57 @@ class ThumbnailWidget(QWidget):
             QMessageBox.warning(self, "Warning", "Please open a PDF first")
             return
 
-        try:
-            # Parse input format (source,target)
-            text = self.move_input.text().strip()
-
-            # Extract source and target page numbers
-            nums = text.split(",")
-            if len(nums) != 2:
-                raise ValueError("Invalid format")
-
-            source = int(nums[0]) - 1  # Convert to 0-based index
-            target = int(nums[1]) - 1
-
-            # Validate page numbers
-            if source < 0 or source >= len(self.parent.current_pdf) or target < 0 or target >= len(self.parent.current_pdf):
-                raise ValueError("Invalid page numbers")
-
-            if source == target:
-                return
+        # Parse input format (source,target)
+        match = self._MOVE_RE.match(self.move_input.text())
+        n_pages = len(self.parent.current_pdf)
+        source = int(match.group(1)) - 1 if match else -1  # Convert to 0-based index
+        target = int(match.group(2)) - 1 if match else -1
 
-            try:
-                # Create a new PDF with reordered pages
-                new_pdf = fitz.open()
-
-                # If moving forward (e.g., 1 to 8)
-                if target > source:
-                    # Copy pages before source
-                    for i in range(source):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i, to_page=i)
-
-                    # Copy pages between source and target, shifting up
-                    for i in range(source, target):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i+1, to_page=i+1)
-
-                    # Insert source page at target position
-                    new_pdf.insert_pdf(self.parent.current_pdf, from_page=source, to_page=source)
-
-                    # Copy remaining pages
-                    for i in range(target+1, len(self.parent.current_pdf)):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i, to_page=i)
-
-                # If moving backward (e.g., 8 to 1)
-                else:
-                    # Copy pages before target
-                    for i in range(target):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i, to_page=i)
-
-                    # Insert source page at target position
-                    new_pdf.insert_pdf(self.parent.current_pdf, from_page=source, to_page=source)
-
-                    # Copy pages between target and source, shifting down
-                    for i in range(target, source):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i, to_page=i)
-
-                    # Copy remaining pages
-                    for i in range(source+1, len(self.parent.current_pdf)):
-                        new_pdf.insert_pdf(self.parent.current_pdf, from_page=i, to_page=i)
+        # Validate page numbers
+        if not (0 <= source < n_pages and 0 <= target < n_pages):
+            QMessageBox.warning(self, "Warning", "Please use format: source,target (e.g., 2,3)")
+            return
 
-                # Save to a temporary file
-                temp_path = self.parent.current_pdf.name + ".temp"
-                new_pdf.save(temp_path)
-                new_pdf.close()
+        if source == target:
+            return
 
-                # Close current PDF and replace with new one
-                self.parent.current_pdf.close()
-                os.replace(temp_path, self.parent.current_pdf.name)
+        try:
+            self.parent._move_page(source + 1, target + 1)
 
-                # Reload the PDF
-                self.parent.current_pdf = fitz.open(self.parent.current_pdf.name)
-                self.parent.display_page()
-                self.load_thumbnails(self.parent.current_pdf)
+            # Add move to history
+            self.parent.add_to_move_history(source, target)
 
-                # Add move to history
-                self.parent.add_to_move_history(source, target)
+            # Clear the move input
+            self.move_input.clear()
 
-                # Clear the move input
-                self.move_input.clear()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error moving pages: {str(e)}")
+# ============================================================================
+# Merge List
+# ============================================================================
 
-        except ValueError:
-            QMessageBox.warning(self, "Warning", "Please use format: source,target (e.g., 2,3)")
-            return
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Paint a Remove button in every row and report which row was clicked"""
+    remove_requested = pyqtSignal(int)  # row
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = "Remove"
+        button.state = QStyle.State_Enabled
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def createEditor(self, parent, option, index):
+        return None  # the button column holds no editable text
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            self.remove_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 # ============================================================================
 # Main app
@@ -323,22 +662,20 @@ class ThumbnailWidget(QWidget):
 class PDFApp(QMainWindow):
     """Main application window for PDF viewing, merging and splitting operations"""
 
+    _RANGE_RE = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")  # "page" or "first-last"
+
     # == UI Setup Helpers ================================================================================================================================
     def _setup_button(self, button, font_size=11, width=None, height=36):
         """Configure button appearance and size"""
         if width:
             button.setFixedWidth(width)
         button.setMinimumHeight(height)
-        font = button.font()
-        font.setPointSize(font_size)
-        button.setFont(font)
+        button.setFont(_font(font_size))
         return button
 
     def _set_font(self, widget, size=11):
         """Helper method to set font for widgets"""
-        font = widget.font()
-        font.setPointSize(size)
-        widget.setFont(font)
+        widget.setFont(_font(size))
         return widget
 
     def _add_navigation_to_layout(self, layout, prev_btn, page_label, page_input, total_pages_label, next_btn):
@@ -369,9 +706,44 @@ class PDFApp(QMainWindow):
         self.current_pdf = None
         self.current_page = None
         self.zoom_factor = 1.0
+        if Config.LIMIT_RENDERING_CACHE:
+            fitz.TOOLS.set_aa_level(0)  # cheaper rasterization at the cost of jagged edges
+        # Coalesce a burst of wheel zoom steps into one render
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(Config.ZOOM_WHEEL_DELAY_MS)
+        self._zoom_timer.timeout.connect(self.display_page)
+        # Page steps of a held arrow key are applied together
+        self._nav_steps = 0
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(Config.KEY_REPEAT_RENDER_MS)
+        self._nav_timer.timeout.connect(self._apply_page_steps)
+        # Render a typed zoom value once editing settles
+        self._zoom_debounce = QTimer(self)
+        self._zoom_debounce.setSingleShot(True)
+        self._zoom_debounce.setInterval(Config.ZOOM_INPUT_DELAY_MS)
+        self._zoom_debounce.timeout.connect(self.display_page)
+        # Zoom label text for every whole percent within the zoom limits
+        low, high = (int(limit * 100) for limit in Config.ZOOM_LIMITS)
+        self._zoom_labels = {percent: f"{percent}%" for percent in range(low, high + 1)}
+        self._pix_cache = OrderedDict()  # (page, zoom, dpr) -> rendered QPixmap, least recently used first
+        self._pix_cache_bytes = 0
+        self._matrix_cache = {}  # zoom factor -> render matrix
+        self._renders_since_shrink = 0  # renders since MuPDF's store was last shrunk blindly
+        self._last_render_key = None  # cache key of the page on display
+        # Neighbouring pages are rendered ahead on one worker, MuPDF is not thread-safe
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_signals = PageRenderSignals(self)
+        self._prefetch_signals.rendered.connect(self._on_page_rendered)
+        self._prefetch_generation = 0
+        self._prefetching = set()  # cache keys queued on the prefetch pool
         self.merge_list = []
-        self.move_history = []  # Store history of page moves (source, target)
-        self.history_index = -1  # Current position in history
+        self._merge_set = set()  # paths in merge_list, for constant time duplicate checks
+        self._pdf_magic_cache = {}  # (path, mtime, size) -> whether the file starts with %PDF
+        self.move_history = deque(maxlen=Config.UNDO_DEPTH)  # Page moves (source, target) that can be undone
+        self.redo_stack = deque(maxlen=Config.UNDO_DEPTH)  # Undone page moves that can be redone
         self.setFocusPolicy(Qt.StrongFocus)
 
     def _setup_window(self):
@@ -396,38 +768,34 @@ class PDFApp(QMainWindow):
 
     def add_to_move_history(self, source, target):
         """Add a page move operation to history"""
-        # Remove any future history if we're not at the end
-        if self.history_index < len(self.move_history) - 1:
-            self.move_history = self.move_history[:self.history_index + 1]
-
-        # Add the new move to history
+        # A new move forgets undone moves, the deque drops the oldest beyond the undo depth
         self.move_history.append((source, target))
-        self.history_index = len(self.move_history) - 1
+        self.redo_stack.clear()
 
     def undo_page(self):
         """Undo the last page move operation"""
-        if not self.current_pdf or self.history_index < 0:
+        if not self.current_pdf or not self.move_history:
             return
 
         try:
-            source, target = self.move_history[self.history_index]
+            source, target = self.move_history[-1]
             # When undoing, we move from target back to source
             self._move_page(target + 1, source + 1)  # Adding 1 because move_page expects 1-based indices
-            self.history_index -= 1
+            self.redo_stack.append(self.move_history.pop())
             # Don't add this reverse move to history since it's an undo operation
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error undoing page move: {str(e)}")
 
     def redo_page(self):
         """Redo the last undone page move operation"""
-        if not self.current_pdf or self.history_index >= len(self.move_history) - 1:
+        if not self.current_pdf or not self.redo_stack:
             return
 
         try:
-            self.history_index += 1
-            source, target = self.move_history[self.history_index]
+            source, target = self.redo_stack[-1]
             # When redoing, we move from source to target again
             self._move_page(source + 1, target + 1)  # Adding 1 because move_page expects 1-based indices
+            self.move_history.append(self.redo_stack.pop())
             # Don't add this move to history since it's a redo operation
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error redoing page move: {str(e)}")
@@ -435,56 +803,37 @@ class PDFApp(QMainWindow):
     def _move_page(self, source, target):
         """Helper method to move a page without adding to history"""
         try:
-            # Create a new PDF with reordered pages
-            new_pdf = fitz.open()
             source = source - 1  # Convert to 0-based index
             target = target - 1
 
-            # If moving forward (e.g., 1 to 8)
-            if target > source:
-                # Copy pages before source
-                for i in range(source):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i, to_page=i)
-
-                # Copy pages between source and target, shifting up
-                for i in range(source, target):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i+1, to_page=i+1)
-
-                # Insert source page at target position
-                new_pdf.insert_pdf(self.current_pdf, from_page=source, to_page=source)
-
-                # Copy remaining pages
-                for i in range(target+1, len(self.current_pdf)):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i, to_page=i)
-
-            # If moving backward (e.g., 8 to 1)
-            else:
-                # Copy pages before target
-                for i in range(target):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i, to_page=i)
-
-                # Insert source page at target position
-                new_pdf.insert_pdf(self.current_pdf, from_page=source, to_page=source)
-
-                # Copy pages between target and source, shifting down
-                for i in range(target, source):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i, to_page=i)
-
-                # Copy remaining pages
-                for i in range(source+1, len(self.current_pdf)):
-                    new_pdf.insert_pdf(self.current_pdf, from_page=i, to_page=i)
-
-            # Save to a temporary file
-            temp_path = self.current_pdf.name + ".temp"
-            new_pdf.save(temp_path)
-            new_pdf.close()
-
-            # Close current PDF and replace with new one
-            self.current_pdf.close()
-            os.replace(temp_path, self.current_pdf.name)
-
-            # Reload the PDF
-            self.current_pdf = fitz.open(self.current_pdf.name)
+            # Reorder the page tree in place
+            order = list(range(len(self.current_pdf)))
+            order.insert(target, order.pop(source))
+            self.current_pdf.select(order)
+
+            # Append only the changed objects instead of rewriting the file,
+            # documents not backed by a file have nothing to persist
+            if self.current_pdf.name:
+                # Background renders read the file being appended to
+                self.thumbnail_widget.stop_rendering()
+                self._stop_prefetch()
+                pdf_path = self.current_pdf.name
+                if self.current_pdf.can_save_incrementally():
+                    self.current_pdf.saveIncr()
+                    self.current_pdf.close()
+                else:
+                    # Repaired or re-encrypted files must be rewritten in full
+                    temp_path = pdf_path + ".temp"
+                    self.current_pdf.save(temp_path)
+                    self.current_pdf.close()
+                    os.replace(temp_path, pdf_path)
+                # A handle that saved incrementally writes its next section over
+                # the previous one, reopen so the following move appends cleanly
+                self.current_pdf = _open_pdf(pdf_path)
+
+            # Cached pages no longer match the page order, thumbnails are
+            # keyed by the file's size and mtime so the saved file gets new ones
+            self._clear_page_cache()
             self.display_page()
             self.thumbnail_widget.load_thumbnails(self.current_pdf)
 
@@ -509,9 +858,7 @@ class PDFApp(QMainWindow):
         # Set size for mode buttons
         for btn in [viewer_btn, merge_btn, split_btn]:
             btn.setMinimumHeight(40)
-            font = btn.font()
-            font.setPointSize(11)
-            btn.setFont(font)
+            self._set_font(btn)
         viewer_btn.clicked.connect(lambda: self.stack_widget.setCurrentIndex(0))
         split_btn.clicked.connect(lambda: self.stack_widget.setCurrentIndex(1))
         merge_btn.clicked.connect(lambda: self.stack_widget.setCurrentIndex(2))
@@ -525,6 +872,7 @@ class PDFApp(QMainWindow):
         self.stack_widget.addWidget(self.create_viewer_page())
         self.stack_widget.addWidget(self.create_split_page())
         self.stack_widget.addWidget(self.create_merge_page())
+        self.stack_widget.currentChanged.connect(self._sync_split_preview)
         layout.addWidget(self.stack_widget)
 
     # == Viewer page ================================================================================================================================
@@ -551,8 +899,8 @@ class PDFApp(QMainWindow):
         self.zoom_label.editingFinished.connect(lambda: self.update_zoom_from_input(self.zoom_label.text()))
         open_btn.clicked.connect(self.open_pdf)
         close_btn.clicked.connect(self.close_pdf)
-        zoom_in_btn.clicked.connect(lambda: self.zoom_view(1.2))
-        zoom_out_btn.clicked.connect(lambda: self.zoom_view(0.8))
+        zoom_in_btn.clicked.connect(partial(self.zoom_view, 1.2))
+        zoom_out_btn.clicked.connect(partial(self.zoom_view, 0.8))
 
         # Create undo/redo buttons
         undo_btn = self._setup_button(QPushButton("↶"), width=40)
@@ -634,6 +982,7 @@ class PDFApp(QMainWindow):
         page_input.setFixedWidth(100)
         self._set_font(page_input)
         page_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        page_input.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d{1,6}"), page_input))
         total_pages_label = self._set_font(QLabel("/ 0"))
 
         prev_btn.clicked.connect(self.prev_page)
@@ -649,6 +998,7 @@ class PDFApp(QMainWindow):
         zoom_label.setFixedWidth(90)
         self._set_font(zoom_label, 12)
         zoom_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        zoom_label.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d{1,4}%?"), zoom_label))
         zoom_in_btn = self._setup_button(QPushButton("+"), font_size=14, width=40)
 
         return zoom_out_btn, zoom_label, zoom_in_btn
@@ -683,8 +1033,8 @@ class PDFApp(QMainWindow):
 
         # Connect events
         zoom_label.editingFinished.connect(lambda: self.update_zoom_from_input(zoom_label.text()))
-        zoom_in_btn.clicked.connect(lambda: self.zoom_view(1.2))
-        zoom_out_btn.clicked.connect(lambda: self.zoom_view(0.8))
+        zoom_in_btn.clicked.connect(partial(self.zoom_view, 1.2))
+        zoom_out_btn.clicked.connect(partial(self.zoom_view, 0.8))
 
         # Add all controls to layout using helper methods
         button_layout.addWidget(open_btn)
@@ -698,21 +1048,13 @@ class PDFApp(QMainWindow):
 
         # Add split controls
         split_controls = QHBoxLayout()
-        split_label = QLabel("Split at pages:")
-        font = split_label.font()
-        font.setPointSize(11)
-        split_label.setFont(font)
+        split_label = self._set_font(QLabel("Split at pages:"))
         self.split_input = QLineEdit()
         self.split_input.setFixedWidth(280)
         self.split_input.setPlaceholderText("e.g., 1,4;2-3;5-6")
         self.split_input.setMinimumHeight(36)
-        font = self.split_input.font()
-        font.setPointSize(11)
-        self.split_input.setFont(font)
-        split_btn = QPushButton("Split PDF")
-        font = split_btn.font()
-        font.setPointSize(11)
-        split_btn.setFont(font)
+        self._set_font(self.split_input)
+        split_btn = self._set_font(QPushButton("Split PDF"))
         split_btn.clicked.connect(self.split_pdf)
         split_controls.addWidget(split_label)
         split_controls.addWidget(self.split_input)
@@ -751,34 +1093,8 @@ class PDFApp(QMainWindow):
                 return
 
             # explain page ranges (format: "1,4;2-3;5-6")
-            try:
-                parts = ranges_text.split(";")
-                page_groups = []
-
-                for part in parts:
-                    pages = set()
-                    segments = part.split(",")
-
-                    for segment in segments:
-                        segment = segment.strip()
-                        if "-" in segment:
-                            # Handle range (e.g., "2-5")
-                            start, end = map(int, segment.split("-"))
-                            # Convert to 0-based index
-                            pages.update(range(start - 1, end))
-                        else:
-                            # Handle single page
-                            pages.add(int(segment) - 1)
-
-                    # Convert to sorted list
-                    page_groups.append(sorted(pages))
-
-                # Validate page numbers
-                all_pages = [p for group in page_groups for p in group]
-                if any(p < 0 or p >= len(self.current_pdf) for p in all_pages):
-                    raise ValueError("Invalid page numbers")
-
-            except ValueError:
+            page_groups = self._parse_page_groups(ranges_text, len(self.current_pdf))
+            if page_groups is None:
                 QMessageBox.warning(self, "Warning", "Please enter valid page numbers in format: 1,4;2-3;5-6")
                 return
 
@@ -788,29 +1104,74 @@ class PDFApp(QMainWindow):
                 return
 
             # Create a subfolder for split files
-            base_name = self.current_pdf.name.rsplit(".", 1)[0].split("/")[-1].split("\\")[-1]
-            split_folder = f"{output_dir}/{base_name}_split"
+            base_name = PurePath(self.current_pdf.name).stem
+            split_folder = os.path.join(output_dir, f"{base_name}_split")
             os.makedirs(split_folder, exist_ok=True)
 
-            # Create PDFs for each group
-            for i, pages in enumerate(page_groups):
-                # Create new PDF document
-                output_pdf = fitz.open()
-
-                # Add pages from the group
-                for page_num in pages:
-                    output_pdf.insert_pdf(self.current_pdf, from_page=page_num, to_page=page_num)
-
-                # Save the split PDF
-                output_path = f"{split_folder}/part{i+1}.pdf"
-                output_pdf.save(output_path)
-                output_pdf.close()
+            # Create PDFs for each group, MuPDF stays on this thread and only the
+            # serialized parts are written to disk concurrently
+            with ThreadPoolExecutor(max_workers=min(Config.SPLIT_WRITE_THREADS, len(page_groups))) as executor:
+                writes = []
+                for i, pages in enumerate(page_groups):
+                    # Create new PDF document
+                    output_pdf = fitz.open()
+
+                    # Add pages from the group, one call per run of consecutive pages
+                    # sharing copied resources until the last one
+                    runs = self._page_runs(pages)
+                    for n, (first, last) in enumerate(runs, start=1):
+                        output_pdf.insert_pdf(self.current_pdf, from_page=first, to_page=last,
+                                              final=n == len(runs))
+
+                    # Save the split PDF
+                    output_path = os.path.join(split_folder, f"part{i+1}.pdf")
+                    writes.append(executor.submit(self._write_file, output_path, output_pdf.tobytes()))
+                    output_pdf.close()
+
+                # Surface the first failed write
+                for write in writes:
+                    write.result()
 
             QMessageBox.information(self, "Success", f"PDF split successfully into {len(page_groups)} parts!")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error splitting PDF: {str(e)}")
 
+    @staticmethod
+    def _write_file(path, data):
+        """Write bytes to a file"""
+        with open(path, "wb") as f:
+            f.write(data)
+
+    @staticmethod
+    def _page_runs(pages):
+        """Collapse sorted page numbers into [first, last] runs of consecutive pages"""
+        runs = []
+        for page in pages:
+            if runs and runs[-1][1] == page - 1:
+                runs[-1][1] = page
+            else:
+                runs.append([page, page])
+        return runs
+
+    def _parse_page_groups(self, ranges_text, n_pages):
+        """Parse "1,4;2-3;5-6" into sorted 0-based page lists, None if invalid"""
+        page_groups = []
+        for part in ranges_text.split(";"):
+            # Mark the selected pages, yielding them in order without duplicates
+            mask = bytearray(n_pages)
+            for segment in part.split(","):
+                match = self._RANGE_RE.match(segment)
+                if not match:
+                    return None
+                first = int(match.group(1))
+                last = int(match.group(2) or first)
+                if not 1 <= first <= last <= n_pages:
+                    return None
+                mask[first - 1:last] = b"\x01" * (last - first + 1)
+            page_groups.append([page for page, selected in enumerate(mask) if selected])
+        return page_groups
+
     # == merge page ================================================================================================================================
     def create_merge_page(self):
         """Create the merge page with PDF merging functionality"""
@@ -827,9 +1188,7 @@ class PDFApp(QMainWindow):
         # Set size and font for buttons
         for btn in [add_btn, merge_btn]:
             btn.setMinimumHeight(40)
-            font = btn.font()
-            font.setPointSize(11)
-            btn.setFont(font)
+            self._set_font(btn)
         merge_layout.addWidget(add_btn)
         merge_layout.addWidget(merge_btn)
         merge_layout.addSpacing(5)
@@ -840,6 +1199,10 @@ class PDFApp(QMainWindow):
         self.merge_table.setHorizontalHeaderLabels(["File Name", "Action"])
         self.merge_table.setMinimumHeight(300)
         self.merge_table.setColumnWidth(0, 450)
+        # One delegate paints every Remove button instead of a widget per row
+        self.remove_delegate = RemoveButtonDelegate(self.merge_table)
+        self.remove_delegate.remove_requested.connect(self.remove_from_merge)
+        self.merge_table.setItemDelegateForColumn(1, self.remove_delegate)
         merge_layout.addWidget(self.merge_table)
 
         return merge_page
@@ -852,11 +1215,11 @@ class PDFApp(QMainWindow):
             for fname in fnames:
                 try:
                     # Verify it's a valid PDF
-                    with open(fname, "rb") as file:
-                        if file.read(4) != b"%PDF":
-                            raise ValueError(f"{fname} is not a valid PDF file")
-                    if fname not in self.merge_list:
+                    if not self._is_pdf(fname):
+                        raise ValueError(f"{fname} is not a valid PDF file")
+                    if fname not in self._merge_set:
                         self.merge_list.append(fname)
+                        self._merge_set.add(fname)
                         added = True
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Error adding PDF: {str(e)}")
@@ -865,24 +1228,27 @@ class PDFApp(QMainWindow):
 
     def update_merge_table(self):
         """Update the merge list table"""
-        self.merge_table.setRowCount(len(self.merge_list))
-        for i, pdf_path in enumerate(self.merge_list):
-            try:
-                # Add filename (use backslashes for Windows paths)
-                filename = pdf_path.replace("/", "\\").split("\\")[-1]
-                self.merge_table.setItem(i, 0, QTableWidgetItem(filename))
-
-                # Add remove button
-                remove_btn = QPushButton("Remove")
-                remove_btn.clicked.connect(lambda checked, row=i: self.remove_from_merge(row))
-                self.merge_table.setCellWidget(i, 1, remove_btn)
-            except Exception as e:
-                print(f"Error updating table row {i}: {str(e)}")
+        # Fill every row with one repaint at the end
+        self.merge_table.setUpdatesEnabled(False)
+        self.merge_table.blockSignals(True)
+        try:
+            self.merge_table.setRowCount(len(self.merge_list))
+            for i, pdf_path in enumerate(self.merge_list):
+                try:
+                    # Add filename
+                    filename = PurePath(pdf_path).name
+                    self.merge_table.setItem(i, 0, QTableWidgetItem(filename))
+                except Exception as e:
+                    print(f"Error updating table row {i}: {str(e)}")
+        finally:
+            self.merge_table.blockSignals(False)
+            self.merge_table.setUpdatesEnabled(True)
 
     def remove_from_merge(self, row):
         """Remove a PDF from the merge list"""
-        self.merge_list.pop(row)
-        self.update_merge_table()
+        self._merge_set.discard(self.merge_list.pop(row))
+        # Only the removed row changes, the rows below shift up with their items
+        self.merge_table.removeRow(row)
 
     def merge_pdfs(self):
         """Merge selected PDFs into a single file"""
@@ -894,25 +1260,30 @@ class PDFApp(QMainWindow):
             return
 
         try:
+            # Ask for the destination first so a cancelled save merges nothing
+            fname, _ = QFileDialog.getSaveFileName(self, "Save Merged PDF", "", "PDF files (*.pdf)")
+            if not fname:
+                return
+
             # Create output PDF
             output_pdf = fitz.open()
-
-            # Add all PDFs to the output
-            for pdf_path in self.merge_list:
-                pdf = fitz.open(pdf_path)
-                output_pdf.insert_pdf(pdf)
-                pdf.close()
-
-            # Save merged PDF
-            fname, _ = QFileDialog.getSaveFileName(self, "Save Merged PDF", "", "PDF files (*.pdf)")
-            if fname:
-                output_pdf.save(fname)
+            try:
+                # Add all PDFs to the output
+                # one source open at a time, closed even if copying it fails
+                for pdf_path in self.merge_list:
+                    with fitz.open(pdf_path) as pdf:
+                        output_pdf.insert_pdf(pdf)
+
+                # Save merged PDF, dropping duplicate objects and compressing streams
+                output_pdf.save(fname, garbage=4, deflate=True)
+            finally:
                 output_pdf.close()
-                QMessageBox.information(self, "Success", "PDFs merged successfully!")
+            QMessageBox.information(self, "Success", "PDFs merged successfully!")
 
-                # Clear the merge list and table
-                self.merge_list = []
-                self.update_merge_table()
+            # Clear the merge list and table
+            self.merge_list = []
+            self._merge_set.clear()
+            self.update_merge_table()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error merging PDFs: {str(e)}")
@@ -935,16 +1306,7 @@ class PDFApp(QMainWindow):
     def handle_zoom(self, event):
         """Handle zoom with Ctrl+Mouse wheel for viewer page"""
         if event.modifiers() & Qt.ControlModifier:
-            if event.angleDelta().y() > 0:
-                self.zoom_factor *= 1.2  # Zoom in
-            else:
-                self.zoom_factor /= 1.2  # Zoom out
-            self.zoom_factor = max(Config.ZOOM_LIMITS[0], min(self.zoom_factor, Config.ZOOM_LIMITS[1]))  # Limit zoom range
-            # Update zoom labels
-            self.zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
-            if hasattr(self, "split_zoom_label"):
-                self.split_zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
-            self.display_page()  # Refresh display with new zoom
+            self._wheel_zoom(event)
         else:
             # Normal scroll behavior
             QScrollArea.wheelEvent(self.scroll, event)
@@ -952,20 +1314,18 @@ class PDFApp(QMainWindow):
     def handle_split_zoom(self, event):
         """Handle zoom with Ctrl+Mouse wheel for split page"""
         if event.modifiers() & Qt.ControlModifier:
-            if event.angleDelta().y() > 0:
-                self.zoom_factor *= 1.2  # Zoom in
-            else:
-                self.zoom_factor /= 1.2  # Zoom out
-            self.zoom_factor = max(Config.ZOOM_LIMITS[0], min(self.zoom_factor, Config.ZOOM_LIMITS[1]))  # Limit zoom range
-            # Update zoom labels
-            if hasattr(self, "split_zoom_label"):
-                self.split_zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
-            self.zoom_label.setText(f"{int(self.zoom_factor * 100)}%")
-            self.display_page()  # Refresh display with new zoom
+            self._wheel_zoom(event)
         else:
             # Normal scroll behavior
             QScrollArea.wheelEvent(self.split_scroll, event)
 
+    def _wheel_zoom(self, event):
+        """Zoom one step per wheel tick, rendering once the ticks settle"""
+        step = Config.ZOOM_STEP if event.angleDelta().y() > 0 else 1 / Config.ZOOM_STEP
+        self._apply_zoom_factor(step)
+        self._update_zoom_displays()  # labels follow every tick
+        self._zoom_timer.start()
+
     # == PDF Operations ============================================================================================================================================
     def open_pdf(self):
         """Load and display a PDF file"""
@@ -990,23 +1350,34 @@ class PDFApp(QMainWindow):
     def _validate_pdf_file(self, fname):
         """Validate that file is a PDF"""
         try:
-            with open(fname, "rb") as file:
-                if file.read(4) != Config.PDF_MAGIC_NUMBER:
-                    QMessageBox.warning(self, "Warning", "Not a valid PDF file")
-                    return False
+            if not self._is_pdf(fname):
+                QMessageBox.warning(self, "Warning", "Not a valid PDF file")
+                return False
             return True
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error validating PDF: {str(e)}")
             return False
 
+    def _is_pdf(self, fname):
+        """Check the PDF magic number, remembered until the file changes"""
+        stat = os.stat(fname)
+        key = (fname, stat.st_mtime_ns, stat.st_size)
+        is_pdf = self._pdf_magic_cache.get(key)
+        if is_pdf is None:
+            fd = os.open(fname, os.O_RDONLY)
+            try:
+                is_pdf = os.read(fd, len(Config.PDF_MAGIC_NUMBER)) == Config.PDF_MAGIC_NUMBER
+            finally:
+                os.close(fd)
+            self._pdf_magic_cache[key] = is_pdf
+        return is_pdf
+
     def _load_and_display_pdf(self, fname):
         """Load PDF file and update display"""
         self.close_pdf()
 
         try:
-            self.current_pdf = fitz.open(fname)
-            if not self.current_pdf.is_pdf:
-                raise ValueError("Not a valid PDF file")
+            self.current_pdf = _open_pdf(fname)
 
             # Reset view state for new PDF
             self.current_page = 0
@@ -1015,14 +1386,15 @@ class PDFApp(QMainWindow):
             # update page input and total pages
             self._update_page_controls()
 
+            # Show the first page before any thumbnail work is queued
+            self.display_page()
+
             # Load thumbnails if we're in viewer mode
             if hasattr(self, 'thumbnail_widget'):
                 self.thumbnail_widget.load_thumbnails(self.current_pdf)
                 # Enforce thumbnail panel width
                 self.viewer_splitter.setSizes([270, self.width() - 270])
 
-            self.display_page()
-
         except Exception as e:
             self.close_pdf()
             raise
@@ -1060,14 +1432,13 @@ class PDFApp(QMainWindow):
             if hasattr(self, "split_zoom_label"):
                 self.split_zoom_label.setText("100%")
 
+            # Drop arrow key steps meant for the closed document
+            self._nav_timer.stop()
+            self._nav_steps = 0
+
             # Reset page displays
-            # Viewer page
-            self.page_input.setText("")
+            self._set_page_inputs("")
             self.total_pages_label.setText("/ 0")
-
-            # Split page
-            if hasattr(self, "split_page_input"):
-                self.split_page_input.setText("")
             if hasattr(self, "split_total_pages_label"):
                 self.split_total_pages_label.setText("/ 0")
             if hasattr(self, "split_input"):
@@ -1078,6 +1449,16 @@ class PDFApp(QMainWindow):
                 self.current_pdf.close()
                 self.current_pdf = None
                 self.current_page = None
+                # Fonts and images cached for the closed document are no use to the next
+                with _RENDER_LOCK:
+                    fitz.TOOLS.store_shrink(100)
+
+            # Rendered pages belong to the closed document
+            self._clear_page_cache()
+
+            # Page moves only apply to the document they were made on
+            self.move_history.clear()
+            self.redo_stack.clear()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error closing PDF: {str(e)}")
@@ -1086,57 +1467,191 @@ class PDFApp(QMainWindow):
 
     def go_to_page(self):
         """Go to specific page number"""
-        try:
-            if not self.current_pdf:
-                return
+        if not self.current_pdf or not self.page_input.text():
+            return
 
-            # Get page number from input, convert to 0-based index
-            page_num = int(self.page_input.text()) - 1
+        # The input's validator only accepts digits, convert to 0-based index
+        page_num = int(self.page_input.text()) - 1
 
-            # Validate page number
-            if 0 <= page_num < len(self.current_pdf):
-                # self.add_to_history(self.current_page)  # Add current page to history
-                self.current_page = page_num
-                self.display_page()
-            else:
-                # Reset to current page
-                self.page_input.setText(str(self.current_page + 1))
-                QMessageBox.warning(self, "Warning", "Invalid page number")
-        except ValueError:
-            # Reset to current page if input is not a number
+        # Validate page number
+        if 0 <= page_num < len(self.current_pdf):
+            # self.add_to_history(self.current_page)  # Add current page to history
+            self.current_page = page_num
+            self.display_page()
+        else:
+            # Reset to current page
             self.page_input.setText(str(self.current_page + 1))
-            QMessageBox.warning(self, "Warning", "Please enter a valid page number")
+            QMessageBox.warning(self, "Warning", "Invalid page number")
+
+    def _set_page_inputs(self, text):
+        """Show text in the viewer and split page inputs without emitting their signals"""
+        inputs = [self.page_input]
+        if hasattr(self, "split_page_input"):
+            inputs.append(self.split_page_input)
+        for page_input in inputs:
+            if page_input.text() != text:
+                page_input.blockSignals(True)
+                page_input.setText(text)
+                page_input.blockSignals(False)
 
     def display_page(self):
         """Display the current PDF page with zoom factor"""
         if not self.current_pdf or not isinstance(self.current_page, int):
             return
 
+        # Nothing to do if this page is already shown at this zoom
+        key = self._page_key(self.current_page)
+        if key == self._last_render_key and self.pdf_label.pixmap() is not None:
+            return
+
         try:
             # Get the current page from the PDF
             page = self.current_pdf[self.current_page]
 
             # Update page input in both viewer and split pages
-            self.page_input.setText(str(self.current_page + 1))
-            if hasattr(self, "split_page_input"):
-                self.split_page_input.setText(str(self.current_page + 1))
-
-            # Use matrix for better quality rendering
-            matrix = fitz.Matrix(self.zoom_factor, self.zoom_factor)
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
-
-            # Convert to QImage and QPixmap efficiently
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(img)
+            self._set_page_inputs(str(self.current_page + 1))
+
+            # Reuse the page if it was rendered at this zoom recently
+            dpr = key[2]
+            pixmap = self._pix_cache.get(key)
+            if pixmap is None:
+                # Zooming out shrinks a sharper render of the page that is still cached
+                pixmap = self._shrink_cached_page(page, key)
+            if pixmap is not None:
+                self._pix_cache.move_to_end(key)
+            else:
+                # Rasterize straight to device pixels so HiDPI screens don't upscale
+                pix = page.get_pixmap(matrix=self._zoom_matrix(self.zoom_factor * dpr), alpha=False)
+                pixmap = QPixmap.fromImage(_page_image(pix, dpr))
+                del pix  # the pixmap has its own pixels, free the raster before trimming the store
+                self._cache_page_pixmap(key, pixmap)
+                self._trim_mupdf_store()
 
-            # Update the display in both viewer and split pages
-            self.pdf_label.setPixmap(pixmap)
-            if hasattr(self, "split_preview_label"):
-                self.split_preview_label.setPixmap(pixmap)
+            self._show_page_pixmap(key, pixmap)
+            self._prefetch_neighbours()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error displaying PDF: {str(e)}")
 
+    def _shrink_cached_page(self, page, key):
+        """Scale down the closest cached higher zoom render of a page, None if there is none"""
+        page_num, zoom, dpr = key
+        higher = [cached_zoom for cached_page, cached_zoom, cached_dpr in self._pix_cache
+                  if cached_page == page_num and cached_dpr == dpr and cached_zoom > zoom]
+        if not higher:
+            return None
+
+        # Match the size MuPDF would have rendered at this zoom
+        size = page.rect.transform(self._zoom_matrix(self.zoom_factor * dpr)).irect
+        source = self._pix_cache[(page_num, min(higher), dpr)]
+        pixmap = source.scaled(size.width, size.height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(dpr)
+        self._cache_page_pixmap(key, pixmap)
+        return pixmap
+
+    def _show_page_pixmap(self, key, pixmap):
+        """Update the display, the split preview catches up when it is shown"""
+        self._last_render_key = key
+        self.pdf_label.setPixmap(pixmap)
+        if hasattr(self, "split_preview_label") and self.split_preview_label.isVisible():
+            self.split_preview_label.setPixmap(pixmap)
+
+    def _page_key(self, page_num):
+        """Cache key of a page rendered at the current zoom and device pixel ratio"""
+        return (page_num, round(self.zoom_factor, 3), self.pdf_label.devicePixelRatioF())
+
+    def _sync_split_preview(self, index):
+        """Show the current page in the split preview when switching to split mode"""
+        pixmap = self.pdf_label.pixmap()
+        if self.split_preview_label.isVisible() and pixmap is not None:
+            self.split_preview_label.setPixmap(pixmap)
+
+    def _prefetch_neighbours(self):
+        """Render the pages before and after the current one in the background"""
+        # Workers open the file themselves, in-memory documents are rendered on demand
+        if not self.current_pdf.name:
+            return
+        scale = self.zoom_factor * self.pdf_label.devicePixelRatioF()
+        for page_num in (self.current_page + 1, self.current_page - 1):
+            if not 0 <= page_num < len(self.current_pdf):
+                continue
+            # MuPDF holds the GIL while rendering, prefetching a heavy page would freeze the GUI
+            rect = self.current_pdf[page_num].rect
+            if rect.width * rect.height * scale * scale <= Config.PREFETCH_MAX_PIXELS:
+                self._queue_page_render(page_num)
+
+    def _queue_page_render(self, page_num):
+        """Render a page at the current zoom on the worker unless it is cached or queued"""
+        key = self._page_key(page_num)
+        if key in self._pix_cache or key in self._prefetching:
+            return
+        self._prefetching.add(key)
+        self._prefetch_pool.start(PageRenderTask(self.current_pdf.name, page_num, self.zoom_factor, key[2],
+                                                 self._prefetch_generation, self._prefetch_signals))
+
+    def _on_page_rendered(self, generation, page_num, zoom, img):
+        """Cache a page rendered ahead by the worker"""
+        if generation != self._prefetch_generation:
+            return
+        key = (page_num, round(zoom, 3), img.devicePixelRatioF())
+        self._prefetching.discard(key)
+        if key not in self._pix_cache:
+            self._cache_page_pixmap(key, QPixmap.fromImage(img))
+        # Prefetched renders fill MuPDF's store as much as inline ones
+        self._trim_mupdf_store()
+
+    def _cache_page_pixmap(self, key, pixmap):
+        """Remember a rendered page, evicting the least recently shown beyond the limits"""
+        self._pix_cache[key] = pixmap
+        self._pix_cache_bytes += pixmap.width() * pixmap.height() * 4
+        while len(self._pix_cache) > 1 and (len(self._pix_cache) > Config.PAGE_CACHE_MAX
+                                            or self._pix_cache_bytes > Config.PAGE_CACHE_LIMIT_BYTES):
+            _, evicted = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= evicted.width() * evicted.height() * 4
+
+    def _zoom_matrix(self, zoom):
+        """Render matrix of a zoom factor, reused while zooming back and forth"""
+        matrix = self._matrix_cache.get(zoom)
+        if matrix is None:
+            if len(self._matrix_cache) >= Config.ZOOM_MATRIX_CACHE_MAX:
+                self._matrix_cache.clear()
+            matrix = self._matrix_cache[zoom] = fitz.Matrix(zoom, zoom)
+        return matrix
+
+    def _trim_mupdf_store(self):
+        """Shrink MuPDF's resource store back under Config.MUPDF_STORE_BYTES"""
+        if Config.LIMIT_RENDERING_CACHE:
+            with _RENDER_LOCK:
+                fitz.TOOLS.store_shrink(100)
+            return
+        size = _mupdf_store_size()
+        if size is None:
+            # The build can't tell how full the store is, trim a fixed share every few renders
+            self._renders_since_shrink += 1
+            if self._renders_since_shrink >= Config.MUPDF_STORE_SHRINK_RENDERS:
+                self._renders_since_shrink = 0
+                with _RENDER_LOCK:
+                    fitz.TOOLS.store_shrink(Config.MUPDF_STORE_SHRINK_PERCENT)
+        elif size > Config.MUPDF_STORE_BYTES:
+            with _RENDER_LOCK:
+                fitz.TOOLS.store_shrink(100 - 100 * Config.MUPDF_STORE_BYTES // size)
+
+    def _clear_page_cache(self):
+        """Forget rendered pages once they no longer match the document"""
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
+        self._last_render_key = None
+        self._stop_prefetch()
+
+    def _stop_prefetch(self):
+        """Drop queued page prefetches, wait for the running one and ignore its result"""
+        self._prefetch_pool.clear()
+        self._prefetch_pool.waitForDone()
+        with _RENDER_LOCK:
+            _close_worker_documents(_page_documents)
+        self._prefetch_generation += 1
+        self._prefetching.clear()
+
     def zoom_view(self, factor):
         """Zoom the viewer page"""
         self._apply_zoom_factor(factor)
@@ -1145,15 +1660,12 @@ class PDFApp(QMainWindow):
 
     def update_zoom_from_input(self, text):
         """Update zoom based on input percentage"""
-        try:
-            zoom = self._parse_zoom_input(text)
-            if zoom is not None:
-                self.zoom_factor = zoom
-                self._update_zoom_displays()
-                if self.current_pdf:
-                    self.display_page()
-        except ValueError:
-            self._update_zoom_displays()
+        zoom = self._parse_zoom_input(text)
+        if zoom is not None:
+            self.zoom_factor = zoom
+            if self.current_pdf:
+                self._zoom_debounce.start()
+        self._update_zoom_displays()
 
     def _apply_zoom_factor(self, factor):
         """Apply zoom factor with limits"""
@@ -1161,28 +1673,53 @@ class PDFApp(QMainWindow):
         self.zoom_factor = max(Config.ZOOM_LIMITS[0], min(self.zoom_factor, Config.ZOOM_LIMITS[1]))
 
     def _parse_zoom_input(self, text):
-        """Parse and validate zoom input"""
-        try:
-            zoom = float(text.strip("%")) / 100.0
-            return max(Config.ZOOM_LIMITS[0], min(zoom, Config.ZOOM_LIMITS[1]))
-        except ValueError:
+        """Parse zoom input, the input's validator only lets digits and a percent sign through"""
+        text = text.strip("% ")
+        if not text:
             return None
+        zoom = float(text) / 100.0
+        return max(Config.ZOOM_LIMITS[0], min(zoom, Config.ZOOM_LIMITS[1]))
 
     def _update_zoom_displays(self):
         """Update all zoom displays"""
-        zoom_text = f"{int(self.zoom_factor * 100)}%"
+        percent = int(self.zoom_factor * 100)
+        zoom_text = self._zoom_labels.get(percent) or f"{percent}%"
         self.zoom_label.setText(zoom_text)
         if hasattr(self, "split_zoom_label"):
             self.split_zoom_label.setText(zoom_text)
 
     def keyPressEvent(self, event):
         """Handle keyboard events for navigation"""
-        if event.key() == Qt.Key_Left:
-            self.prev_page()
-        elif event.key() == Qt.Key_Right:
-            self.next_page()
+        step = {Qt.Key_Left: -1, Qt.Key_Right: 1}.get(event.key())
+        if step and self.current_pdf and isinstance(self.current_page, int):
+            self._nav_steps += step
+            if event.isAutoRepeat():
+                # Show where a held key has got to, render it once the interval is up
+                self._set_page_inputs(str(self._page_after_steps() + 1))
+                if not self._nav_timer.isActive():
+                    self._nav_timer.start()
+            else:
+                self._nav_timer.stop()
+                self._apply_page_steps()
         event.accept()
 
+    def _page_after_steps(self):
+        """Current page moved by the pending arrow key steps, within the document"""
+        return max(0, min(self.current_page + self._nav_steps, len(self.current_pdf) - 1))
+
+    def _apply_page_steps(self):
+        """Show the page the pending arrow key steps lead to"""
+        if self.current_pdf and isinstance(self.current_page, int):
+            self.current_page = self._page_after_steps()
+            self.display_page()
+        self._nav_steps = 0
+
+    def closeEvent(self, event):
+        """Let background renders finish before the window goes away"""
+        self._stop_prefetch()
+        self.thumbnail_widget.stop_rendering()
+        super().closeEvent(event)
+
 
 
 def main():
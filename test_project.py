@@ -1,9 +1,16 @@
 import os
 import sys
+import shutil
+import threading
+from collections import deque
+from types import SimpleNamespace
 import pytest
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QPushButton
+from PyQt5.QtGui import QImage, QKeyEvent, QPixmapCache, QWheelEvent
+from PyQt5.QtCore import Qt, QEvent, QPoint, QPointF
+from PyQt5.QtTest import QTest
 import fitz
-from project import PDFApp, Config
+from project import PDFApp, Config, _font, _mupdf_store_size, _open_pdf, _page_image, _page_documents, _thumbnail_documents, ThumbnailTask
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -42,6 +49,26 @@ def pdf_app(app, tmp_path):
     pdf_app.deleteLater()
     app.processEvents()
 
+def wait_for_thumbnails(pdf_app, app):
+    """Let pending thumbnail renders finish and deliver their results"""
+    # Layout, paint and queued render requests each take an event loop pass
+    for _ in range(4):
+        app.processEvents()
+        pdf_app.thumbnail_widget._render_pool.waitForDone()
+    app.processEvents()
+
+@pytest.fixture
+def gui_renders(monkeypatch):
+    """Record (page number, scale) of every page rendered on the GUI thread"""
+    renders = []
+    real_get_pixmap = fitz.Page.get_pixmap
+    def recording_get_pixmap(page, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread():  # skip background workers
+            renders.append((page.number, kwargs.get("matrix", fitz.Identity).a))
+        return real_get_pixmap(page, *args, **kwargs)
+    monkeypatch.setattr(fitz.Page, "get_pixmap", recording_get_pixmap)
+    return renders
+
 # ============================================================================
 # Viewer Tests
 # ============================================================================
@@ -53,6 +80,26 @@ def test_pdf_loading(pdf_app):
     assert pdf_app.current_page == 0
     assert pdf_app.zoom_factor == 1.0
 
+def test_open_pdf_requires_pdf(tmp_path):
+    """Test documents are always opened as PDF, other files are rejected"""
+    text_file = tmp_path / "notes.pdf"
+    text_file.write_text("not a pdf")
+    with pytest.raises(Exception):
+        _open_pdf(str(text_file))
+    with _open_pdf(TEST_PDF) as pdf:
+        assert pdf.is_pdf
+
+def test_limit_rendering_cache(pdf_app, monkeypatch):
+    """Test memory mode empties MuPDF's store after each render"""
+    monkeypatch.setattr(Config, "LIMIT_RENDERING_CACHE", True)
+    shrinks = []
+    monkeypatch.setattr(fitz.TOOLS, "store_shrink", shrinks.append)
+    monkeypatch.setattr(pdf_app, "_prefetch_neighbours", lambda: None)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    shrinks.clear()
+    pdf_app.next_page()
+    assert shrinks == [100]
+
 def test_page_navigation(pdf_app):
     """Test page navigation functionality"""
     pdf_app._load_and_display_pdf(TEST_PDF)
@@ -66,6 +113,219 @@ def test_page_navigation(pdf_app):
     pdf_app.prev_page()
     assert pdf_app.current_page == initial_page
 
+def test_page_inputs_updated_quietly(pdf_app):
+    """Test navigation updates both page inputs without emitting text signals"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    changes = []
+    pdf_app.page_input.textChanged.connect(changes.append)
+    pdf_app.split_page_input.textChanged.connect(changes.append)
+
+    pdf_app.next_page()
+    assert pdf_app.page_input.text() == pdf_app.split_page_input.text() == "2"
+    pdf_app.close_pdf()
+    assert pdf_app.page_input.text() == pdf_app.split_page_input.text() == ""
+    assert changes == []
+
+def test_held_arrow_key_coalesced(pdf_app):
+    """Test auto-repeated arrow keys render the page they lead to once per interval"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    shown = []
+    pdf_app._nav_timer.timeout.connect(lambda: shown.append(pdf_app.current_page))
+
+    repeat = QKeyEvent(QEvent.KeyPress, Qt.Key_Right, Qt.NoModifier, "", True)
+    for _ in range(3):
+        pdf_app.keyPressEvent(repeat)
+    assert pdf_app.current_page == 0
+    assert pdf_app.page_input.text() == "4"
+
+    QTest.qWait(Config.KEY_REPEAT_RENDER_MS * 3)
+    assert shown == [3]
+
+    # A single press still moves right away
+    pdf_app.keyPressEvent(QKeyEvent(QEvent.KeyPress, Qt.Key_Left, Qt.NoModifier))
+    assert pdf_app.current_page == 2
+
+def test_page_pixels(pdf_app):
+    """Test the displayed page matches MuPDF's rendering"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    pix = pdf_app.current_pdf[0].get_pixmap(alpha=False)
+    shown = pdf_app.pdf_label.pixmap().toImage().convertToFormat(QImage.Format_RGB888)
+    assert (shown.width(), shown.height()) == (pix.width, pix.height)
+    row = pix.height // 2
+    stride = shown.bytesPerLine()
+    line = shown.constBits().asstring(stride * shown.height())[row * stride:row * stride + pix.width * 3]
+    assert line == pix.samples[row * pix.stride:row * pix.stride + pix.width * 3]
+
+def test_page_device_pixel_ratio(pdf_app, monkeypatch):
+    """Test pages are rasterized at device resolution on HiDPI screens"""
+    monkeypatch.setattr(pdf_app.pdf_label, "devicePixelRatioF", lambda: 2.0)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    rect = pdf_app.current_pdf[0].rect
+    pixmap = pdf_app.pdf_label.pixmap()
+    assert pixmap.devicePixelRatio() == 2.0
+    assert pixmap.width() == pytest.approx(rect.width * 2, abs=1)
+    assert (0, 1.0, 2.0) in pdf_app._pix_cache
+
+def test_page_image_owns_pixels(pdf_app):
+    """Test page images are 32-bit and keep their pixels once MuPDF's raster is freed"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    pix = pdf_app.current_pdf[0].get_pixmap(alpha=False)
+    expected = pix.pixel(pix.width // 2, pix.height // 2)
+    img = _page_image(pix, 1.0)
+    del pix
+    assert img.format() == QImage.Format_RGB32
+    color = img.pixelColor(img.width() // 2, img.height() // 2)
+    assert (color.red(), color.green(), color.blue()) == expected
+
+def test_page_render_cache(pdf_app, tmp_path, monkeypatch, gui_renders):
+    """Test revisited pages are shown without rendering them again"""
+    monkeypatch.setattr(Config, "PAGE_CACHE_MAX", 2)
+    pdf_path = str(tmp_path / "cache.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    monkeypatch.setattr(pdf_app, "_prefetch_neighbours", lambda: None)
+    pdf_app._load_and_display_pdf(pdf_path)
+    gui_renders.clear()
+
+    for page_num in (1, 0, 1, 2, 0):
+        pdf_app.current_page = page_num
+        pdf_app.display_page()
+    # Page 0 was evicted by page 2 as the least recently shown
+    assert [page_num for page_num, scale in gui_renders] == [1, 2, 0]
+    assert len(pdf_app._pix_cache) == 2
+
+    # Moving a page invalidates the rendered pages
+    pdf_app._move_page(1, 2)
+    assert list(pdf_app._pix_cache) == [(pdf_app.current_page, 1.0, 1.0)]
+
+def test_unchanged_page_not_redrawn(pdf_app, monkeypatch):
+    """Test showing the displayed page again at the same zoom is a no-op"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    shown = []
+    monkeypatch.setattr(pdf_app, "_show_page_pixmap", lambda key, pixmap: shown.append(key[0]))
+    pdf_app.zoom_view(1.0)
+    pdf_app.display_page()
+    assert shown == []
+
+    pdf_app.next_page()
+    assert shown == [1]
+
+def test_zoom_out_scales_cached_page(pdf_app, monkeypatch, gui_renders):
+    """Test zooming out shrinks a cached sharper render instead of rendering again"""
+    monkeypatch.setattr(pdf_app, "_prefetch_neighbours", lambda: None)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    pdf_app.zoom_view(1.5)
+    expected = pdf_app.current_pdf[0].get_pixmap(matrix=fitz.Matrix(1.2, 1.2))
+    gui_renders.clear()
+
+    pdf_app._clear_page_cache()
+    pdf_app.display_page()
+    pdf_app.zoom_factor = 1.2
+    pdf_app.display_page()
+    assert gui_renders == [(0, pytest.approx(1.5))]
+    shown = pdf_app.pdf_label.pixmap()
+    assert (shown.width(), shown.height()) == (expected.width, expected.height)
+
+    # Zooming in renders the page again
+    pdf_app.zoom_factor = 2.0
+    pdf_app.display_page()
+    assert gui_renders == [(0, pytest.approx(1.5)), (0, pytest.approx(2.0))]
+
+def test_page_prefetch(pdf_app, app, gui_renders):
+    """Test the pages next to the displayed one are rendered in the background"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    app.processEvents()
+    pdf_app._prefetch_pool.waitForDone()
+    app.processEvents()
+    assert (1, 1.0, 1.0) in pdf_app._pix_cache
+
+    # Navigating to a prefetched page does not render on the GUI thread
+    gui_renders.clear()
+    pdf_app.next_page()
+    assert pdf_app.current_page == 1
+    assert gui_renders == []
+
+def test_prefetch_document_reused(pdf_app, app, monkeypatch):
+    """Test the page worker opens the document once while prefetching and releases it when stopped"""
+    monkeypatch.setattr(Config, "THUMBNAIL_WARM_PAGES", 0)
+    opens = []
+    def recording_open_pdf(path):
+        if threading.current_thread() is not threading.main_thread():
+            opens.append(path)
+        return _open_pdf(path)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    pdf_app._stop_prefetch()
+    monkeypatch.setattr("project._open_pdf", recording_open_pdf)
+    for _ in range(3):
+        pdf_app.next_page()
+        pdf_app._prefetch_pool.waitForDone()
+        app.processEvents()
+    assert opens == [TEST_PDF]
+
+    pdf_app._stop_prefetch()
+    assert _page_documents == {}
+
+def test_large_page_not_prefetched(pdf_app, monkeypatch):
+    """Test neighbouring pages above the prefetch size limit are left to render on demand"""
+    monkeypatch.setattr(Config, "PREFETCH_MAX_PIXELS", 0)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert pdf_app._prefetching == set()
+
+def test_mupdf_store_trimmed(pdf_app, monkeypatch):
+    """Test MuPDF's store is shrunk after renders and emptied when the PDF closes"""
+    shrinks = []
+    monkeypatch.setattr("project._mupdf_store_size", lambda: 4 * Config.MUPDF_STORE_BYTES)
+    monkeypatch.setattr(fitz.TOOLS, "store_shrink", shrinks.append)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert shrinks == [75]
+
+    pdf_app.close_pdf()
+    assert shrinks == [75, 100]
+
+def test_mupdf_store_shrunk_without_size(pdf_app, monkeypatch):
+    """Test builds that don't report the store size shrink it by a fixed share every few renders"""
+    if _mupdf_store_size() is not None:
+        pytest.skip("this PyMuPDF build reports the store size")
+    monkeypatch.setattr(Config, "MUPDF_STORE_SHRINK_RENDERS", 2)
+    monkeypatch.setattr(pdf_app, "_prefetch_neighbours", lambda: None)
+    shrinks = []
+    monkeypatch.setattr(fitz.TOOLS, "store_shrink", shrinks.append)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert shrinks == []
+
+    pdf_app.next_page()
+    assert shrinks == [Config.MUPDF_STORE_SHRINK_PERCENT]
+    pdf_app.next_page()
+    assert shrinks == [Config.MUPDF_STORE_SHRINK_PERCENT]
+
+def test_prefetch_trims_mupdf_store(pdf_app, app, monkeypatch):
+    """Test pages rendered ahead count towards trimming MuPDF's store"""
+    trims = []
+    monkeypatch.setattr(pdf_app, "_trim_mupdf_store", lambda: trims.append(pdf_app.current_page))
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert trims == [0]
+    pdf_app._prefetch_pool.waitForDone()
+    app.processEvents()
+    assert trims == [0, 0]
+
+def test_mupdf_store_size(monkeypatch):
+    """Test the store size is read from both the property and the method form of Tools.store_size"""
+    monkeypatch.setattr(fitz, "TOOLS", SimpleNamespace(store_size=1024))
+    assert _mupdf_store_size() == 1024
+    monkeypatch.setattr(fitz, "TOOLS", SimpleNamespace(store_size=lambda: 2048))
+    assert _mupdf_store_size() == 2048
+
+def test_zoom_matrix_cache(pdf_app, monkeypatch):
+    """Test render matrices are reused per zoom factor and bounded"""
+    monkeypatch.setattr(Config, "ZOOM_MATRIX_CACHE_MAX", 2)
+    matrix = pdf_app._zoom_matrix(1.2)
+    assert pdf_app._zoom_matrix(1.2) is matrix
+    assert (matrix.a, matrix.d) == (1.2, 1.2)
+
+    pdf_app._zoom_matrix(1.44)
+    pdf_app._zoom_matrix(2.0)
+    assert len(pdf_app._matrix_cache) <= 2
+
 def test_zoom_operations(pdf_app):
     """Test zoom functionality"""
     pdf_app._load_and_display_pdf(TEST_PDF)
@@ -78,6 +338,73 @@ def test_zoom_operations(pdf_app):
     # Test zoom out
     pdf_app.zoom_view(0.8)
     assert pdf_app.zoom_factor < initial_zoom
+    assert pdf_app.zoom_label.text() == f"{int(pdf_app.zoom_factor * 100)}%"
+
+def test_shared_fonts(pdf_app):
+    """Test widgets of the same point size share one font"""
+    assert _font(11) is _font(11)
+    assert _font(14).pointSize() == 14
+    assert pdf_app.split_input.font().pointSize() == 11
+
+def test_pdf_magic_number_cache(pdf_app, tmp_path, monkeypatch):
+    """Test PDF validation reads each unchanged file only once"""
+    text_path = tmp_path / "notes.txt"
+    text_path.write_bytes(b"not a pdf")
+    assert pdf_app._is_pdf(TEST_PDF)
+    assert not pdf_app._is_pdf(str(text_path))
+
+    def fail_open(*args):
+        raise AssertionError("cached file was read again")
+    monkeypatch.setattr(os, "open", fail_open)
+    assert pdf_app._is_pdf(TEST_PDF)
+    monkeypatch.undo()
+
+    # A rewritten file is checked again
+    text_path.write_bytes(b"%PDF-1.7")
+    assert pdf_app._is_pdf(str(text_path))
+
+def test_wheel_zoom_coalesced(pdf_app):
+    """Test a burst of Ctrl+wheel ticks renders the page once"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    renders = []
+    pdf_app._zoom_timer.timeout.connect(lambda: renders.append(pdf_app.zoom_factor))
+
+    wheel = QWheelEvent(QPointF(10, 10), QPointF(10, 10), QPoint(), QPoint(0, 120),
+                        Qt.NoButton, Qt.ControlModifier, Qt.NoScrollPhase, False)
+    for _ in range(3):
+        pdf_app.handle_zoom(wheel)
+    assert renders == []
+    assert pdf_app.zoom_label.text() == f"{int(Config.ZOOM_STEP ** 3 * 100)}%"
+
+    QTest.qWait(Config.ZOOM_WHEEL_DELAY_MS * 5)
+    assert renders == [pytest.approx(Config.ZOOM_STEP ** 3)]
+
+def test_zoom_and_page_input_validation(pdf_app):
+    """Test the zoom and page inputs only accept numbers"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    for line_edit, good, bad in ((pdf_app.zoom_label, "150%", "1.5x"), (pdf_app.page_input, "2", "two")):
+        validator = line_edit.validator()
+        assert validator.validate(good, 0)[0] == validator.Acceptable
+        assert validator.validate(bad, 0)[0] == validator.Invalid
+    assert pdf_app._parse_zoom_input("%") is None
+
+    pdf_app.page_input.setText("2")
+    pdf_app.go_to_page()
+    assert pdf_app.current_page == 1
+
+def test_zoom_input_debounced(pdf_app):
+    """Test typed zoom values render once editing settles"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    renders = []
+    pdf_app._zoom_debounce.timeout.connect(lambda: renders.append(pdf_app.zoom_factor))
+
+    for text in ("1", "15", "150"):
+        pdf_app.update_zoom_from_input(text)
+    assert renders == []
+    assert pdf_app.zoom_label.text() == "150%"
+
+    QTest.qWait(Config.ZOOM_INPUT_DELAY_MS * 2)
+    assert renders == [pytest.approx(1.5)]
 
 # ============================================================================
 # Split Tests
@@ -88,6 +415,18 @@ def test_split_page_switch(pdf_app):
     pdf_app.stack_widget.setCurrentIndex(1)
     assert pdf_app.stack_widget.currentIndex() == 1
 
+def test_split_preview_synced(pdf_app):
+    """Test the split preview is only updated while visible and catches up on switch"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert pdf_app.split_preview_label.pixmap() is None
+
+    pdf_app.next_page()
+    pdf_app.stack_widget.setCurrentIndex(1)
+    assert pdf_app.split_preview_label.pixmap().cacheKey() == pdf_app.pdf_label.pixmap().cacheKey()
+
+    pdf_app.prev_page()
+    assert pdf_app.split_preview_label.pixmap().cacheKey() == pdf_app.pdf_label.pixmap().cacheKey()
+
 def test_split_functionality(pdf_app, tmp_path, monkeypatch):
     """Test PDF splitting with input validation"""
     # Load the test PDF
@@ -113,6 +452,47 @@ def test_split_functionality(pdf_app, tmp_path, monkeypatch):
     files_created = [f for f in os.listdir(tmp_path) if f.endswith('.pdf')]
     assert len(files_created) == 0, "No PDF files should be created with invalid input"
 
+def test_split_output(pdf_app, tmp_path, monkeypatch):
+    """Test each page group is written to its own part file"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    texts = [page.get_text().strip() for page in pdf_app.current_pdf]
+
+    monkeypatch.setattr('PyQt5.QtWidgets.QFileDialog.getExistingDirectory',
+                        lambda *args: str(tmp_path))
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.information', lambda *args: None)
+    pdf_app.split_input.setText("1,4;2-3;5-8")
+    pdf_app.split_pdf()
+
+    split_folder = tmp_path / "numbers_split"
+    for part, pages in enumerate(([0, 3], [1, 2], [4, 5, 6, 7]), start=1):
+        with fitz.open(str(split_folder / f"part{part}.pdf")) as output_pdf:
+            assert [page.get_text().strip() for page in output_pdf] == [texts[p] for p in pages]
+
+def test_split_page_ranges(pdf_app):
+    """Test split page ranges are parsed into ordered 0-based page groups"""
+    assert pdf_app._parse_page_groups("1,4;2-3;5-6", 8) == [[0, 3], [1, 2], [4, 5]]
+    assert pdf_app._parse_page_groups(" 3 , 1-2 ,2 ; 8 ", 8) == [[0, 1, 2], [7]]
+    for invalid in ("1-9", "0", "3-2", "1,,2", "1;", "a-b", "1-2-3"):
+        assert pdf_app._parse_page_groups(invalid, 8) is None, invalid
+
+def test_split_page_runs(pdf_app):
+    """Test split pages are copied in runs of consecutive pages"""
+    assert pdf_app._page_runs([0, 1, 2, 4, 6, 7]) == [[0, 2], [4, 4], [6, 7]]
+    assert pdf_app._page_runs([]) == []
+
+def test_mode_and_zoom_buttons(pdf_app):
+    """Test toolbar buttons switch modes and zoom when clicked"""
+    buttons = {}
+    for button in pdf_app.findChildren(QPushButton):
+        buttons.setdefault(button.text(), button)
+    QTest.mouseClick(buttons["Merge PDFs"], Qt.LeftButton)
+    assert pdf_app.stack_widget.currentIndex() == 2
+    QTest.mouseClick(buttons["Viewer"], Qt.LeftButton)
+    assert pdf_app.stack_widget.currentIndex() == 0
+
+    QTest.mouseClick(buttons["+"], Qt.LeftButton)
+    assert pdf_app.zoom_factor == pytest.approx(1.2)
+
 # ============================================================================
 # Merge Tests
 # ============================================================================
@@ -125,14 +505,43 @@ def test_merge_page_switch(pdf_app):
 def test_merge_list_operations(pdf_app):
     """Test merge list management"""
     # Add PDF to merge list
-    pdf_app.merge_list.append(TEST_PDF)
+    pdf_app.merge_list.append(os.path.abspath(TEST_PDF))
     pdf_app.update_merge_table()
     assert len(pdf_app.merge_list) == 1
+    assert pdf_app.merge_table.item(0, 0).text() == "numbers.pdf"
 
     # Remove PDF from merge list
     pdf_app.remove_from_merge(0)
     assert len(pdf_app.merge_list) == 0
 
+def test_merge_add_duplicates(pdf_app, tmp_path, monkeypatch):
+    """Test adding files already in the merge list keeps a single entry"""
+    other_pdf = str(tmp_path / "other.pdf")
+    shutil.copy(TEST_PDF, other_pdf)
+    monkeypatch.setattr('PyQt5.QtWidgets.QFileDialog.getOpenFileNames',
+                        lambda *args: ([TEST_PDF, other_pdf, TEST_PDF], Config.PDF_FILTER))
+    pdf_app.add_to_merge()
+    pdf_app.add_to_merge()
+    assert pdf_app.merge_list == [TEST_PDF, other_pdf]
+
+    # A removed file can be added again
+    pdf_app.remove_from_merge(0)
+    pdf_app.add_to_merge()
+    assert pdf_app.merge_list == [other_pdf, TEST_PDF]
+
+def test_merge_remove_button(pdf_app):
+    """Test clicking a row's Remove button drops that file from the merge list"""
+    pdf_app.merge_list = ["first.pdf", "second.pdf", "third.pdf"]
+    pdf_app.update_merge_table()
+    pdf_app.stack_widget.setCurrentIndex(2)
+
+    table = pdf_app.merge_table
+    rect = table.visualRect(table.model().index(1, 1))
+    QTest.mouseClick(table.viewport(), Qt.LeftButton, pos=rect.center())
+    assert pdf_app.merge_list == ["first.pdf", "third.pdf"]
+    assert [table.item(row, 0).text() for row in range(table.rowCount())] == pdf_app.merge_list
+    assert table.updatesEnabled()
+
 def test_merge_functionality(pdf_app, tmp_path):
     """Test PDF merging functionality"""
     # Add test PDF twice to merge list
@@ -158,6 +567,49 @@ def test_merge_functionality(pdf_app, tmp_path):
     except Exception as e:
         pytest.fail(f"Merge operation failed: {str(e)}")
 
+def test_merge_pdfs(pdf_app, tmp_path, monkeypatch):
+    """Test merging writes every page to the chosen file"""
+    output_file = str(tmp_path / "merged.pdf")
+    monkeypatch.setattr('PyQt5.QtWidgets.QFileDialog.getSaveFileName',
+                        lambda *args: (output_file, Config.PDF_FILTER))
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.information', lambda *args: None)
+    pdf_app.merge_list = [TEST_PDF, TEST_PDF]
+    pdf_app.merge_pdfs()
+
+    with fitz.open(TEST_PDF) as source, fitz.open(output_file) as merged:
+        assert len(merged) == 2 * len(source)
+    assert pdf_app.merge_list == []
+
+def test_merge_pdfs_closes_sources(pdf_app, tmp_path, monkeypatch):
+    """Test a failed merge still closes the opened sources"""
+    opened = []
+    real_open = fitz.open
+    def tracking_open(*args):
+        document = real_open(*args)
+        opened.append(document)
+        return document
+    def failing_insert(self, *args, **kwargs):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr('PyQt5.QtWidgets.QFileDialog.getSaveFileName',
+                        lambda *args: (str(tmp_path / "merged.pdf"), Config.PDF_FILTER))
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.critical', lambda *args: None)
+    monkeypatch.setattr(fitz, "open", tracking_open)
+    monkeypatch.setattr(fitz.Document, "insert_pdf", failing_insert)
+    pdf_app.merge_list = [TEST_PDF, TEST_PDF]
+    pdf_app.merge_pdfs()
+
+    assert len(opened) == 2, "output and first source"
+    assert all(document.is_closed for document in opened)
+
+def test_merge_pdfs_cancelled(pdf_app, monkeypatch):
+    """Test cancelling the save dialog does not open the sources"""
+    monkeypatch.setattr('PyQt5.QtWidgets.QFileDialog.getSaveFileName', lambda *args: ("", ""))
+    monkeypatch.setattr(fitz, "open", lambda *args: pytest.fail("sources were merged"))
+    pdf_app.merge_list = [TEST_PDF, TEST_PDF]
+    pdf_app.merge_pdfs()
+    assert pdf_app.merge_list == [TEST_PDF, TEST_PDF]
+
 # ============================================================================
 # Thumbnail Tests
 # ============================================================================
@@ -178,9 +630,170 @@ def test_thumbnail_size_adjustment(pdf_app):
     assert pdf_app.thumbnail_widget.thumbnail_width == new_size
     assert pdf_app.thumbnail_widget.size_value_label.text() == f"{new_size}px"
 
-def test_thumbnail_page_movement(pdf_app):
-    """Test thumbnail page movement functionality"""
+def thumbnail_size(pdf_app, page_num):
+    """Logical size of a thumbnail as shown in the list"""
+    model = pdf_app.thumbnail_widget.thumbnail_model
+    pixmap = model.data(model.index(page_num), Qt.DecorationRole)
+    return pixmap.size() / pixmap.devicePixelRatio()
+
+def test_thumbnail_resize_debounce(pdf_app, monkeypatch):
+    """Test slider drags resize the thumbnails once without reloading them"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+
+    loads = []
+    monkeypatch.setattr(pdf_app.thumbnail_widget, "load_thumbnails", loads.append)
+
+    new_size = Config.THUMBNAIL_DEFAULT_WIDTH + 20
+    for width in range(Config.THUMBNAIL_DEFAULT_WIDTH + 1, new_size + 1):
+        pdf_app.thumbnail_widget.size_slider.setValue(width)
+    assert thumbnail_size(pdf_app, 0).width() == Config.THUMBNAIL_DEFAULT_WIDTH
+
+    pdf_app.thumbnail_widget._resize_timer.timeout.emit()
+    assert thumbnail_size(pdf_app, 0).width() == new_size
+    assert loads == []
+
+def test_thumbnail_slider_release(pdf_app, app):
+    """Test releasing the size slider resizes thumbnails without waiting for the debounce"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    widget = pdf_app.thumbnail_widget
+
+    new_size = Config.THUMBNAIL_DEFAULT_WIDTH + 40
+    widget.size_slider.sliderPressed.emit()
+    widget.size_slider.setValue(new_size)
+    widget._resize_timer.timeout.emit()
+    assert thumbnail_size(pdf_app, 0).width() == new_size
+
+    widget.size_slider.sliderReleased.emit()
+    assert not widget._resize_timer.isActive()
+    assert thumbnail_size(pdf_app, 0).width() == new_size
+
+def test_thumbnail_background_render(pdf_app, app, monkeypatch):
+    """Test thumbnails are rendered off the GUI thread as they scroll into view"""
+    monkeypatch.setattr(Config, "THUMBNAIL_WARM_PAGES", 0)
+    QPixmapCache.clear()
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+
+    model = pdf_app.thumbnail_widget.thumbnail_model
+    page_count = len(pdf_app.current_pdf)
+    assert model.rowCount() == page_count
+    assert model.master(0) is not None
+    assert model.master(page_count - 1) is None, "Pages out of view should not be rendered"
+
+    # Scroll to the end to render the remaining pages
+    pdf_app.thumbnail_widget.list_view.scrollToBottom()
+    wait_for_thumbnails(pdf_app, app)
+    masters = [model.master(page_num) for page_num in range(page_count)]
+    assert all(master is not None for master in masters)
+
+    dpr = pdf_app.thumbnail_widget.devicePixelRatioF()
+    assert all(master.width() == round(Config.THUMBNAIL_MAX_WIDTH * dpr) for master in masters)
+    assert all(master.devicePixelRatio() == dpr for master in masters)
+    assert thumbnail_size(pdf_app, 0).width() == Config.THUMBNAIL_DEFAULT_WIDTH
+
+def test_thumbnail_document_reused(pdf_app, app, monkeypatch):
+    """Test the thumbnail worker opens the document once per load and releases it when stopped"""
+    QPixmapCache.clear()  # render every page rather than reuse thumbnails of earlier tests
+    monkeypatch.setattr(pdf_app, "_prefetch_neighbours", lambda: None)  # the page worker opens its own handle
+    opens = []
+    def recording_open_pdf(path):
+        if threading.current_thread() is not threading.main_thread():
+            opens.append(path)
+        return _open_pdf(path)
+    monkeypatch.setattr("project._open_pdf", recording_open_pdf)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    assert opens == [TEST_PDF]
+
+    pdf_app.thumbnail_widget.stop_rendering()
+    assert _thumbnail_documents == {}
+
+    # Closing the PDF releases the handle as well
+    QPixmapCache.clear()
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    assert _thumbnail_documents
+    pdf_app.close_pdf()
+    assert _thumbnail_documents == {}
+
+def test_thumbnail_model_bounded(pdf_app, app, monkeypatch):
+    """Test the list holds a bounded number of renders and takes dropped ones back from the cache"""
+    monkeypatch.setattr(Config, "THUMBNAIL_MODEL_PAGES", 2)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    model = pdf_app.thumbnail_widget.thumbnail_model
+    assert len(model._masters) == 2
+    assert model.master(0) is None
+
+    # Painting a dropped page finds it in the pixmap cache
+    assert model.restore_master(0)
+    assert model.master(0) is not None
+    assert len(model._masters) == 2
+
+def test_thumbnail_warm_cache(pdf_app, app):
+    """Test thumbnails of pages out of view are rendered once the first page shows"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert pdf_app.pdf_label.pixmap() is not None
+    assert pdf_app.thumbnail_widget._requested == set(), "Thumbnail work should wait for the event loop"
+
+    wait_for_thumbnails(pdf_app, app)
+    model = pdf_app.thumbnail_widget.thumbnail_model
+    assert all(model.master(page_num) is not None for page_num in range(model.rowCount()))
+
+def test_thumbnail_color_mode(pdf_app, app, monkeypatch):
+    """Test thumbnails honour the grayscale setting"""
+    received = []
+    pdf_app.thumbnail_widget._render_signals.rendered.connect(
+        lambda generation, page_num, img: received.append(img.format()))
+
+    for grayscale, expected in ((True, QImage.Format_Grayscale8), (False, QImage.Format_RGB888)):
+        monkeypatch.setattr(Config, "THUMBNAIL_GRAYSCALE", grayscale)
+        QPixmapCache.clear()
+        received.clear()
+        pdf_app._load_and_display_pdf(TEST_PDF)
+        wait_for_thumbnails(pdf_app, app)
+        assert received and all(fmt == expected for fmt in received)
+
+def test_thumbnail_cache(pdf_app, app):
+    """Test rendered thumbnails are cached per page and width"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    key = f"{pdf_app.thumbnail_widget._pdf_id}:0:{pdf_app.thumbnail_widget.devicePixelRatioF()}"
+    assert QPixmapCache.find(key) is not None
+
+    # Closing the PDF keeps the cached thumbnails for when it is reopened
+    pdf_app.close_pdf()
+    assert QPixmapCache.find(key) is not None
+
+def test_thumbnail_reopen(pdf_app, app, monkeypatch):
+    """Test reopening a document shows its thumbnails without rendering them again"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    pdf_app.close_pdf()
+
+    renders = []
+    monkeypatch.setattr(ThumbnailTask, "run", lambda task: renders.append(task.page_num))
     pdf_app._load_and_display_pdf(TEST_PDF)
+    wait_for_thumbnails(pdf_app, app)
+    model = pdf_app.thumbnail_widget.thumbnail_model
+    assert renders == []
+    assert all(model.master(page_num) is not None for page_num in range(model.rowCount()))
+
+def test_thumbnail_click(pdf_app):
+    """Test clicking a thumbnail displays its page"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    list_view = pdf_app.thumbnail_widget.list_view
+    rect = list_view.visualRect(pdf_app.thumbnail_widget.thumbnail_model.index(2))
+    QTest.mouseClick(list_view.viewport(), Qt.LeftButton, pos=rect.center())
+    assert pdf_app.current_page == 2
+
+def test_thumbnail_page_movement(pdf_app, tmp_path):
+    """Test thumbnail page movement functionality"""
+    # Moves are saved to disk, keep the shared fixture untouched
+    pdf_path = str(tmp_path / "move.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    pdf_app._load_and_display_pdf(pdf_path)
 
     # Get initial page contents
     page1_text = pdf_app.current_pdf[0].get_text().strip()
@@ -198,5 +811,110 @@ def test_thumbnail_page_movement(pdf_app):
     assert new_page1_text == page2_text, "First page should contain original second page content"
     assert new_page2_text == page1_text, "Second page should contain original first page content"
 
+def test_thumbnail_page_movement_invalid_input(pdf_app, monkeypatch):
+    """Test malformed or out of range move input only shows a warning"""
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    page_texts = [page.get_text().strip() for page in pdf_app.current_pdf]
+
+    warning_messages = []
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.warning',
+                        lambda parent, title, message: warning_messages.append(message))
+
+    for text in ("2", "a,b", "1,2,3", "0,2", "1,99"):
+        pdf_app.thumbnail_widget.move_input.setText(text)
+        pdf_app.thumbnail_widget.move_page()
+
+    assert len(warning_messages) == 5
+    assert [page.get_text().strip() for page in pdf_app.current_pdf] == page_texts
+
+def test_thumbnail_page_movement_saved(pdf_app, tmp_path):
+    """Test moving a page forward shifts the pages in between and is saved to disk"""
+    pdf_path = str(tmp_path / "move.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    pdf_app._load_and_display_pdf(pdf_path)
+    texts = [page.get_text().strip() for page in pdf_app.current_pdf]
+
+    pdf_app.thumbnail_widget.move_input.setText("1,4")
+    pdf_app.thumbnail_widget.move_page()
+
+    expected = texts[1:4] + texts[:1] + texts[4:]
+    assert [page.get_text().strip() for page in pdf_app.current_pdf] == expected
+
+    saved = fitz.open(pdf_path)
+    assert [page.get_text().strip() for page in saved] == expected
+    saved.close()
+
+def test_page_move_thumbnail_cache(pdf_app, app, tmp_path):
+    """Test a page move gives the file new thumbnails without dropping cached ones of other files"""
+    pdf_path = str(tmp_path / "move.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    pdf_app._load_and_display_pdf(pdf_path)
+    wait_for_thumbnails(pdf_app, app)
+    dpr = pdf_app.thumbnail_widget.devicePixelRatioF()
+    old_key = pdf_app.thumbnail_widget._cache_key(0, dpr)
+
+    pdf_app._move_page(1, 2)
+    assert pdf_app.thumbnail_widget._cache_key(0, dpr) != old_key
+    assert QPixmapCache.find(old_key) is not None
+
+    # Documents without a file are never cached
+    with fitz.open() as memory_pdf:
+        assert pdf_app.thumbnail_widget._document_id(memory_pdf) is None
+
+def test_page_move_full_save(pdf_app, tmp_path, monkeypatch):
+    """Test page moves rewrite the file when it cannot be saved incrementally"""
+    pdf_path = str(tmp_path / "full.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    pdf_app._load_and_display_pdf(pdf_path)
+    texts = [page.get_text().strip() for page in pdf_app.current_pdf]
+
+    monkeypatch.setattr(fitz.Document, "can_save_incrementally", lambda self: False)
+    pdf_app.thumbnail_widget.move_input.setText("1,3")
+    pdf_app.thumbnail_widget.move_page()
+
+    with fitz.open(pdf_path) as saved:
+        assert [page.get_text().strip() for page in saved] == texts[1:3] + texts[:1] + texts[3:]
+    assert os.listdir(tmp_path) == ["full.pdf"]
+
+def test_undo_redo_page_move(pdf_app, tmp_path):
+    """Test undo and redo of a page move are saved to the file"""
+    pdf_path = str(tmp_path / "undo.pdf")
+    shutil.copy(TEST_PDF, pdf_path)
+    pdf_app._load_and_display_pdf(pdf_path)
+    texts = [page.get_text().strip() for page in pdf_app.current_pdf]
+
+    pdf_app.thumbnail_widget.move_input.setText("5,2")
+    pdf_app.thumbnail_widget.move_page()
+    moved = texts[:1] + texts[4:5] + texts[1:4] + texts[5:]
+    assert [page.get_text().strip() for page in pdf_app.current_pdf] == moved
+
+    pdf_app.undo_page()
+    assert [page.get_text().strip() for page in pdf_app.current_pdf] == texts
+
+    pdf_app.redo_page()
+    assert [page.get_text().strip() for page in pdf_app.current_pdf] == moved
+
+    # Each move appends a readable section to the file
+    with fitz.open(pdf_path) as saved:
+        assert [page.get_text().strip() for page in saved] == moved
+
+def test_move_history_limit(pdf_app):
+    """Test page move history keeps only the most recent moves"""
+    pdf_app.move_history = deque(maxlen=3)
+    pdf_app.redo_stack = deque(maxlen=3)
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    for target in range(1, 6):
+        pdf_app.add_to_move_history(0, target)
+    assert list(pdf_app.move_history) == [(0, 3), (0, 4), (0, 5)]
+
+    # A new move forgets undone moves
+    pdf_app.redo_stack.append((1, 2))
+    pdf_app.add_to_move_history(0, 6)
+    assert not pdf_app.redo_stack
+
+    # Opening another document drops its history
+    pdf_app._load_and_display_pdf(TEST_PDF)
+    assert not pdf_app.move_history
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])